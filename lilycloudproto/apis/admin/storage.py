@@ -11,13 +11,13 @@ from lilycloudproto.infra.database import get_db
 from lilycloudproto.infra.repositories.storage_repository import StorageRepository
 from lilycloudproto.infra.services.storage_service import StorageService
 from lilycloudproto.models.admin.storage import (
-    MessageResponse,
     StorageCreate,
     StorageListQuery,
     StorageListResponse,
     StorageResponse,
     StorageUpdate,
 )
+from lilycloudproto.models.message import MessageResponse
 
 router = APIRouter(prefix="/api/admin/storages", tags=["Admin/Storages"])
 
@@ -11,13 +11,13 @@ from lilycloudproto.error import NotFoundError
 from lilycloudproto.infra.database import get_db
 from lilycloudproto.infra.repositories.task_repository import TaskRepository
 from lilycloudproto.models.admin.task import (
-    MessageResponse,
     TaskCreate,
     TaskListQuery,
     TaskListResponse,
     TaskResponse,
     TaskUpdate,
 )
+from lilycloudproto.models.message import MessageResponse
 
 router = APIRouter(prefix="/api/admin/tasks", tags=["Admin/Tasks"])
 
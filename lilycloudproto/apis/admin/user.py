@@ -10,13 +10,13 @@ from lilycloudproto.infra.database import get_db
 from lilycloudproto.infra.repositories.user_repository import UserRepository
 from lilycloudproto.infra.services.auth_service import AuthService
 from lilycloudproto.models.admin.user import (
-    MessageResponse,
     UserCreate,
     UserListQuery,
     UserListResponse,
     UserResponse,
     UserUpdate,
 )
+from lilycloudproto.models.message import MessageResponse
 
 router = APIRouter(prefix="/api/admin/users", tags=["Admin/Users"])
 
@@ -29,12 +29,15 @@ async def create_user(
 ) -> UserResponse:
     """Create a new user."""
     repo = UserRepository(db)
+    # Check for duplicate username before hashing the password.
+    if await repo.exists_by_username(data.username):
+        raise ConflictError(f"Username '{data.username}' already exists.")
     user = User(
         username=data.username,
-        hashed_password=service.password_hash.hash(data.password),
+        hashed_password=await service.hash_password(data.password),
         role=data.role,
     )
-    # Check for duplicate username.
+    # A concurrent request can still take the username in between.
     try:
         created = await repo.create(user)
     except IntegrityError as error:
@@ -97,7 +100,7 @@ async def update_user(
     if data.username is not None:
         user.username = data.username
     if data.password is not None:
-        user.hashed_password = service.password_hash.hash(data.password)
+        user.hashed_password = await service.hash_password(data.password)
     if data.role is not None:
         user.role = data.role
     # Check for duplicate username.
@@ -105,6 +108,7 @@ async def update_user(
         updated = await repo.update(user)
     except IntegrityError as error:
         raise ConflictError(f"Username '{data.username}' already exists.") from error
+    AuthService.evict_user(user_id)
     return UserResponse.model_validate(updated)
 
 
@@ -119,4 +123,5 @@ async def delete_user(
     if not user:
         raise NotFoundError(f"User with ID '{user_id}' not found.")
     await repo.delete(user)
+    AuthService.evict_user(user_id)
     return MessageResponse(message="User deleted successfully.")
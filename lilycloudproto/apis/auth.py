@@ -49,7 +49,7 @@ async def login(
         httponly=True,
         samesite="lax",
         path="/",  # Send for all paths.
-        max_age=auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        max_age=auth_settings.access_token_lifetime,
     )
 
     # Set refresh token cookie only for refresh endpoint.
@@ -60,7 +60,7 @@ async def login(
         httponly=True,
         samesite="lax",
         path="/api/auth",  # Only send for refresh endpoint.
-        max_age=auth_settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+        max_age=auth_settings.refresh_token_lifetime,
     )
 
     return LoginResponse(access_token=access_token, refresh_token=refresh_token)
@@ -87,7 +87,7 @@ async def refresh(
         httponly=True,
         samesite="lax",
         path="/",
-        max_age=auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        max_age=auth_settings.access_token_lifetime,
     )
 
     return RefreshResponse(access_token=refreshed_token)
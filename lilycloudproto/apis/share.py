@@ -14,8 +14,8 @@ from lilycloudproto.infra.database import get_db
 from lilycloudproto.infra.repositories.share_repository import ShareRepository
 from lilycloudproto.infra.repositories.user_repository import UserRepository
 from lilycloudproto.infra.services.auth_service import AuthService
+from lilycloudproto.models.message import MessageResponse
 from lilycloudproto.models.share import (
-    MessageResponse,
     ShareCreate,
     ShareInfoResponse,
     ShareListQuery,
@@ -40,7 +40,7 @@ async def create_share(
     # Hash the password if provided.
     hashed_password = None
     if data.password:
-        hashed_password = service.password_hash.hash(data.password)
+        hashed_password = await service.hash_password(data.password)
 
     # Generate a unique token (using UUID-like string).
     token = str(uuid.uuid4())
@@ -145,7 +145,7 @@ async def update_share(
     if data.password is not None:
         # Hash the password if provided.
         share.hashed_password = (
-            service.password_hash.hash(data.password) if data.password else None
+            await service.hash_password(data.password) if data.password else None
         )
 
     updated_share = await repo.update(share)
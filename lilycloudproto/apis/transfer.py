@@ -1,3 +1,5 @@
+from collections.abc import AsyncGenerator
+
 from fastapi import (
     APIRouter,
     Depends,
@@ -13,6 +15,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lilycloudproto.dependencies import get_storage_service
+from lilycloudproto.domain.driver import DEFAULT_CHUNK_SIZE
 from lilycloudproto.infra.database import get_db
 from lilycloudproto.infra.services.storage_service import StorageService
 from lilycloudproto.infra.services.transfer_service import TransferService
@@ -34,6 +37,13 @@ def _get_transfer_service(
     )
 
 
+async def _upload_stream(
+    file: UploadFile, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncGenerator[bytes]:
+    while chunk := await file.read(chunk_size):
+        yield chunk
+
+
 @router.post("/upload", response_model=TaskResponse)
 async def batch_upload(
     dir: str = Form(..., description="Target directory"),
@@ -45,17 +55,16 @@ async def batch_upload(
     if len(file_names) != len(files):
         raise HTTPException(status_code=400, detail="Invalid filename detected")
 
-    file_contents: list[bytes] = []
-    for f in files:
-        content = await f.read()
-        file_contents.append(content)
-
     task = await service.create_upload_task(
         user_id=0, dst_dir=dir, file_names=file_names
     )
 
+    # Stream each upload to the driver instead of loading it into memory.
     await service.process_upload_files(
-        task_id=task.task_id, dst_dir=dir, files=file_contents, filenames=file_names
+        task_id=task.task_id,
+        dst_dir=dir,
+        streams=[_upload_stream(f) for f in files],
+        filenames=file_names,
     )
     return task
 
@@ -70,10 +70,11 @@ async def list_trash_entries(
         sort_order=query.sort_order,
         dir_first=query.dir_first,
     )
+    # Filters are applied in SQL and the listing is not paginated, so every
+    # matching row is returned and the total needs no separate count query.
     items = await repo.search(args)
-    total = await repo.count(args)
     return TrashListResponse(
-        total=total,
+        total=len(items),
         items=[TrashResponse.model_validate(trash_entry) for trash_entry in items],
     )
 
@@ -1,28 +1,60 @@
+import logging
 import os
 import urllib.parse
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
-from email.utils import format_datetime
+from itertools import chain
 from typing import Annotated
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.etree.ElementTree import Element, SubElement, register_namespace, tostring
 
 from fastapi import APIRouter, Depends, Header, Request, Response
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 
 from lilycloudproto.dependencies import get_auth_service, get_storage_service
 from lilycloudproto.domain.entities.user import User
 from lilycloudproto.domain.values.files.file import File, Type
-from lilycloudproto.domain.values.files.list import ListArgs
-from lilycloudproto.domain.values.files.sort import SortBy, SortOrder
-from lilycloudproto.error import ConflictError, NotFoundError
+from lilycloudproto.error import ConflictError, NotFoundError, WebDAVUnauthorizedError
 from lilycloudproto.infra.services.auth_service import AuthService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/webdav", tags=["WebDAV"])
 security = HTTPBasic()
 
 # WebDAV XML Namespace.
 WEBDAV_NS = "DAV:"
 
+# Serialize elements with the conventional "D" prefix instead of "ns0".
+register_namespace("D", WEBDAV_NS)
+
+# Multistatus envelope for streamed PROPFIND responses.
+MULTISTATUS_HEAD = (
+    b"<?xml version='1.0' encoding='utf-8'?>\n<D:multistatus xmlns:D=\"DAV:\">"
+)
+MULTISTATUS_TAIL = b"</D:multistatus>"
+MULTISTATUS_FLUSH_SIZE = 64 * 1024
+
+# PROPFIND Depth header values, infinity is mapped to -1.
+DEPTHS = {"0": 0, "1": 1, "infinity": -1}
+
+# Day and month names for RFC 1123 dates, independent of the locale.
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
 
 async def get_current_user(
     credentials: Annotated[HTTPBasicCredentials, Depends(security)],
@@ -30,10 +62,19 @@ async def get_current_user(
 ) -> User:
     user = await service.authenticate_basic(credentials.username, credentials.password)
     if not user:
-        raise Exception("Unauthorized")
+        raise WebDAVUnauthorizedError("Unauthorized")
     return user
 
 
+def format_rfc1123(value: datetime) -> str:
+    # Naive values are local times, as drivers build them with fromtimestamp.
+    time = value.astimezone(UTC).timetuple()
+    return (
+        f"{WEEKDAYS[time.tm_wday]}, {time.tm_mday:02d} {MONTHS[time.tm_mon - 1]} "
+        f"{time.tm_year} {time.tm_hour:02d}:{time.tm_min:02d}:{time.tm_sec:02d} GMT"
+    )
+
+
 def create_prop_response(file: File, base_url: str) -> Element:
     response = Element(f"{{{WEBDAV_NS}}}response")
     href = SubElement(response, f"{{{WEBDAV_NS}}}href")
@@ -66,7 +107,7 @@ def create_prop_response(file: File, base_url: str) -> Element:
     creationdate.text = file.created_at.isoformat()
 
     getlastmodified = SubElement(prop, f"{{{WEBDAV_NS}}}getlastmodified")
-    getlastmodified.text = format_datetime(file.modified_at)
+    getlastmodified.text = format_rfc1123(file.modified_at)
 
     # Status.
     status_el = SubElement(propstat, f"{{{WEBDAV_NS}}}status")
@@ -75,6 +116,27 @@ def create_prop_response(file: File, base_url: str) -> Element:
     return response
 
 
+def multistatus_stream(files: Iterable[File], base_url: str) -> Iterator[bytes]:
+    """
+    Serialize PROPFIND responses one file at a time, flushing in batches.
+    Runs in the threadpool since StreamingResponse iterates sync generators there.
+    """
+    buffer = bytearray(MULTISTATUS_HEAD)
+    try:
+        for file in files:
+            buffer += tostring(create_prop_response(file, base_url), encoding="utf-8")
+            if len(buffer) >= MULTISTATUS_FLUSH_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+    except Exception:
+        # The status line is already sent, so abort the response instead of
+        # closing it: a complete but shorter listing reads as deleted files.
+        logger.exception("PROPFIND listing failed mid-stream.")
+        raise
+    buffer += MULTISTATUS_TAIL
+    yield bytes(buffer)
+
+
 @router.api_route("/{path:path}", methods=["PROPFIND"])
 async def webdav_propfind(
     path: str,
@@ -82,15 +144,18 @@ async def webdav_propfind(
     user: Annotated[User, Depends(get_current_user)],
     depth: Annotated[str | None, Header()] = "1",
 ) -> Response:
+    # Reject infinite depth to avoid walking whole trees in a single request.
+    depth_level = DEPTHS.get((depth or "1").strip().lower(), 1)
+    if depth_level < 0:
+        return Response(status_code=403, content="Depth infinity is not supported.")
+
     storage = get_storage_service(request)
     real_path = path if path else "/"
+    base_url = str(request.base_url)
 
     # Normalize root path variations
     is_root = real_path in ("/", "", ".")
 
-    multistatus = Element(f"{{{WEBDAV_NS}}}multistatus")
-    multistatus.set("xmlns:D", WEBDAV_NS)
-
     # Handle root directory specially
     if is_root:
         # Create synthetic root directory File object
@@ -105,13 +170,12 @@ async def webdav_propfind(
             modified_at=datetime.now(UTC),
             accessed_at=datetime.now(UTC),
         )
-        multistatus.append(create_prop_response(root_file, str(request.base_url)))
+        files: Iterable[File] = [root_file]
 
-        # List mounted storages as children if depth != "0"
-        if depth != "0":
+        # List mounted storages as children if depth is not 0.
+        if depth_level > 0:
             mounted_storages = storage.list_mounted_storages(enabled_only=True)
-            for child in mounted_storages:
-                multistatus.append(create_prop_response(child, str(request.base_url)))
+            files = chain(files, mounted_storages)
     else:
         # Normal path handling
         driver = storage.get_driver(real_path)
@@ -121,27 +185,26 @@ async def webdav_propfind(
         except NotFoundError:
             return Response(status_code=404)
 
-        multistatus.append(create_prop_response(current_file, str(request.base_url)))
-
-        if current_file.type == Type.DIRECTORY and depth != "0":
+        files = [current_file]
+        if current_file.type == Type.DIRECTORY and depth_level > 0:
+            # Children are produced lazily while the response is streamed,
+            # but the directory is opened now so that failures get a status.
+            children = driver.iter_dir(real_path)
             try:
-                args = ListArgs(
-                    path=real_path,
-                    sort_by=SortBy.NAME,
-                    sort_order=SortOrder.ASC,
-                )
-                children = driver.list_dir(args)
-                for child in children:
-                    multistatus.append(
-                        create_prop_response(child, str(request.base_url))
-                    )
-            except Exception:
-                pass
-
-    xml_str = tostring(  # pyright: ignore[reportAny]
-        multistatus, encoding="utf-8", xml_declaration=True
+                first_child = next(children, None)
+            except NotFoundError:
+                return Response(status_code=404)
+            except Exception as error:
+                return Response(status_code=500, content=str(error))
+            if first_child is not None:
+                files.append(first_child)
+            files = chain(files, children)
+
+    return StreamingResponse(
+        multistatus_stream(files, base_url),
+        status_code=207,
+        media_type="application/xml",
     )
-    return Response(content=xml_str, status_code=207, media_type="application/xml")
 
 
 @router.get("/{path:path}")
@@ -152,13 +215,15 @@ async def webdav_get(
     driver = storage.get_driver(path)
 
     try:
-        info = driver.info(path)
+        info, content = await driver.open_read(path)
         if info.type == Type.DIRECTORY:
             return Response(status_code=200)
-        generator = driver.read(path)
 
+        if isinstance(content, str):
+            # Let the server send the file itself, with range support.
+            return FileResponse(content, media_type=info.mime_type)
         return StreamingResponse(
-            generator,
+            content,
             media_type=info.mime_type,
             headers={"Content-Length": str(info.size)},
         )
@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from typing import ClassVar
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,9 +21,11 @@ class AuthSettings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
-    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "2"))
-    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", "131072"))  # 128 MiB.
-    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", "2"))
+    # RFC 9106 recommended low-memory Argon2id profile, under 200 ms per hash
+    # on a single core. Stored hashes are upgraded at login when these change.
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", "65536"))  # 64 MiB.
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", "4"))
     model_config: ClassVar[SettingsConfigDict] = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -30,6 +33,16 @@ class AuthSettings(BaseSettings):
         "frozen": True,
     }
 
+    @cached_property
+    def access_token_lifetime(self) -> int:
+        """Access token lifetime in seconds."""
+        return self.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+    @cached_property
+    def refresh_token_lifetime(self) -> int:
+        """Refresh token lifetime in seconds."""
+        return self.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
 
 admin_settings = AdminSettings()
 auth_settings = AuthSettings()
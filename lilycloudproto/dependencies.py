@@ -44,11 +44,18 @@ def get_task_service(request: Request) -> TaskService:
 async def get_current_user(
     request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
-    service: Annotated[AuthService, Depends(get_auth_service)],
+    db: Annotated[AsyncSession, Depends(get_db)],
 ) -> User:
     # Try to get token from cookie first.
     access_token = request.cookies.get("access_token")
     # Fallback to Authorization header if not in cookie.
     if not access_token:
         access_token = token
+
+    # Recently validated tokens are answered from the cache; the session only
+    # checks out a connection once it is used, so cache hits never touch one.
+    user = AuthService.get_cached_user(access_token)
+    if user is not None:
+        return user
+    service = AuthService(auth_settings, db)
     return await service.get_user_from_token(access_token)
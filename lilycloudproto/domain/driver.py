@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
 from enum import Enum
 
 from lilycloudproto.domain.entities.storage import Storage
@@ -7,6 +8,13 @@ from lilycloudproto.domain.values.files.file import File
 from lilycloudproto.domain.values.files.list import ListArgs
 from lilycloudproto.domain.values.files.search import SearchArgs
 
+# Default chunk size for streaming reads. Pass a smaller value explicitly when
+# low latency matters more than throughput, e.g. interactive streaming.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of per-file operations a batch runs at the same time.
+DEFAULT_CONCURRENCY = 8
+
 
 class Base(str, Enum):
     REGULAR = "regular"
@@ -32,6 +40,13 @@ class Driver(ABC):
     def list_dir(self, args: ListArgs) -> list[File]:
         pass
 
+    def iter_dir(self, path: str) -> Iterator[File]:
+        """
+        Iterate over a directory lazily, in no particular order.
+        Drivers that can page through listings should override this.
+        """
+        yield from self.list_dir(ListArgs(path=path))
+
     @abstractmethod
     def info(self, path: str) -> File:
         pass
@@ -75,16 +90,54 @@ class Driver(ABC):
 
     @abstractmethod
     async def write(self, path: str, content_stream: AsyncGenerator[bytes]) -> None:
+        """
+        Write a file from a stream of chunks.
+        Callers should pass chunks as they arrive instead of buffering whole files.
+        """
         pass
 
     @abstractmethod
-    def read(self, path: str, chunk_size: int = 1024 * 64) -> AsyncGenerator[bytes]:
+    def read(
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[bytes]:
         pass
 
+    async def read_view(
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[memoryview]:
+        """
+        Stream file content as views over a buffer reused between chunks.
+        Each view is only valid until the next chunk is requested, so it must
+        be consumed (written or copied) before resuming the generator.
+        """
+        async for chunk in self.read(path, chunk_size):
+            yield memoryview(chunk)
+
+    async def open_read(
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> tuple[File, AsyncGenerator[bytes] | str]:
+        """
+        Return the file info together with its content: the on-disk path of a
+        regular file, for storage that has one (see get_local_path), or else a
+        stream. Drivers that can fetch both in one round-trip should override
+        this.
+        """
+        return self.info(path), self.read(path, chunk_size)
+
     @abstractmethod
     async def get_link(self, path: str) -> str | None:
         pass
 
+    def get_local_path(self, path: str) -> str | None:
+        """
+        Return the on-disk path of a regular file, if the storage has one.
+        Responses can then hand the file to the server (e.g. sendfile) instead
+        of streaming it through Python chunk by chunk. Returns None for
+        directories and for storage without local files. Raises NotFoundError
+        when the storage has local files but nothing exists at the path.
+        """
+        return None
+
     @abstractmethod
     async def rename(self, src_path: str, dst_path: str) -> None:
         pass
@@ -106,3 +159,33 @@ class Driver(ABC):
         progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
     ) -> None:
         pass
+
+    async def _run_batch(
+        self,
+        operations: list[Callable[[], None]],
+        progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        """
+        Run blocking per-file operations in worker threads, bounded by a semaphore.
+        Operations run in a task group, so one failure cancels the rest. Progress
+        is reported from this task as operations complete, so the callback is
+        never invoked concurrently.
+        """
+        total = len(operations)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(operation: Callable[[], None]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(operation)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run(operation)) for operation in operations]
+                for done, future in enumerate(asyncio.as_completed(tasks), 1):
+                    await future
+                    if progress_callback:
+                        await progress_callback(done, total)
+        except ExceptionGroup as error:
+            # Surface the first failure as is, so error handlers still see it.
+            raise error.exceptions[0] from None
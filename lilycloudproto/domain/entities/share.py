@@ -4,7 +4,7 @@ from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from lilycloudproto.domain.values.share import Permission
-from lilycloudproto.infra.database import Base
+from lilycloudproto.infra.database import Base, EnumString, utc_now
 
 
 class Share(Base):
@@ -17,12 +17,17 @@ class Share(Base):
     token: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     base_dir: Mapped[str] = mapped_column(String, nullable=False)
     file_names: Mapped[list[str]] = mapped_column(JSON, nullable=False)
-    permission: Mapped[Permission] = mapped_column(String, nullable=False)
+    permission: Mapped[Permission] = mapped_column(
+        EnumString(Permission), nullable=False
+    )
     hashed_password: Mapped[str | None] = mapped_column(String, nullable=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utc_now, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        default=utc_now,
+        server_default=func.now(),
+        onupdate=utc_now,
     )
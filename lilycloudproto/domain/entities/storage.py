@@ -1,11 +1,11 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, Boolean, DateTime, Enum, Integer, String
+from sqlalchemy import JSON, Boolean, DateTime, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from lilycloudproto.domain.values.admin.storage import StorageType
-from lilycloudproto.infra.database import Base
+from lilycloudproto.infra.database import Base, EnumString, utc_now
 
 
 class Storage(Base):
@@ -13,12 +13,17 @@ class Storage(Base):
 
     storage_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     mount_path: Mapped[str] = mapped_column(String, unique=True, nullable=False)
-    type: Mapped[StorageType] = mapped_column(Enum(StorageType), nullable=False)
+    type: Mapped[StorageType] = mapped_column(
+        EnumString(StorageType, by_name=True), nullable=False
+    )
     config: Mapped[dict[str, str]] = mapped_column(JSON, nullable=False)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utc_now, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        default=utc_now,
+        server_default=func.now(),
+        onupdate=utc_now,
     )
@@ -1,36 +1,52 @@
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Enum, Float, ForeignKey, Integer, Text
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from lilycloudproto.domain.driver import Base as DriverBase
 from lilycloudproto.domain.values.admin.task import TaskStatus, TaskType
-from lilycloudproto.infra.database import Base
+from lilycloudproto.infra.database import Base, EnumString, utc_now
+
+# Status is stored by member name, see EnumString.
+ACTIVE_STATUSES = text("status IN ('PENDING', 'ARCHIVING', 'RUNNING')")
 
 
 class Task(Base):
     __tablename__: str = "tasks"
+    __table_args__: tuple[Index, ...] = (
+        # Only unfinished tasks are indexed, so the index stays small and hot.
+        Index(
+            "ix_tasks_active",
+            "status",
+            "created_at",
+            postgresql_where=ACTIVE_STATUSES,
+            sqlite_where=ACTIVE_STATUSES,
+        ),
+        Index("ix_tasks_user_status", "user_id", "status"),
+    )
 
     task_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False
     )
-    type: Mapped[TaskType] = mapped_column(Enum(TaskType), nullable=False)
+    type: Mapped[TaskType] = mapped_column(
+        EnumString(TaskType, by_name=True), nullable=False
+    )
     base: Mapped[DriverBase] = mapped_column(
-        Enum(DriverBase), nullable=False, default=DriverBase.REGULAR
+        EnumString(DriverBase, by_name=True), nullable=False, default=DriverBase.REGULAR
     )
     src_dir: Mapped[str | None] = mapped_column(Text, nullable=True)
     dst_dirs: Mapped[list[str]] = mapped_column(JSON, nullable=False)
     file_names: Mapped[list[str]] = mapped_column(JSON, nullable=False)
     status: Mapped[TaskStatus] = mapped_column(
-        Enum(TaskStatus), nullable=False, default=TaskStatus.PENDING
+        EnumString(TaskStatus, by_name=True), nullable=False, default=TaskStatus.PENDING
     )
     progress: Mapped[float] = mapped_column(Float, default=0.0)
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utc_now, server_default=func.now()
     )
     started_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -39,5 +55,8 @@ class Task(Base):
         DateTime(timezone=True), nullable=True
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        default=utc_now,
+        server_default=func.now(),
+        onupdate=utc_now,
     )
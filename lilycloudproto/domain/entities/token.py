@@ -1,17 +1,19 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, func
+from sqlalchemy import DateTime, ForeignKey, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from lilycloudproto.domain.values.auth import TokenType
-from lilycloudproto.infra.database import Base
+from lilycloudproto.infra.database import Base, EnumString, utc_now
 
 
 class Token(Base):
     __tablename__: str = "tokens"
 
     token_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    type: Mapped[TokenType] = mapped_column(Enum(TokenType), nullable=False)
+    type: Mapped[TokenType] = mapped_column(
+        EnumString(TokenType, by_name=True), nullable=False
+    )
     user_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=True
     )
@@ -22,8 +24,11 @@ class Token(Base):
         DateTime(timezone=True), nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utc_now, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        default=utc_now,
+        server_default=func.now(),
+        onupdate=utc_now,
     )
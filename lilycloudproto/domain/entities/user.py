@@ -5,7 +5,7 @@ from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from lilycloudproto.domain.values.admin.user import Role
-from lilycloudproto.infra.database import Base
+from lilycloudproto.infra.database import Base, EnumString, utc_now
 
 
 class User(Base):
@@ -16,10 +16,15 @@ class User(Base):
         String, unique=True, index=True, nullable=False
     )
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
-    role: Mapped[Role] = mapped_column(String, nullable=False, server_default=Role.USER)
+    role: Mapped[Role] = mapped_column(
+        EnumString(Role), nullable=False, server_default=Role.USER
+    )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=utc_now, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        default=utc_now,
+        server_default=func.now(),
+        onupdate=utc_now,
     )
@@ -0,0 +1,37 @@
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+# Number of chunks a producer may read ahead of its consumer.
+DEFAULT_BUFFER_CHUNKS = 4
+
+
+async def pipe(
+    source: AsyncGenerator[bytes],
+    sink: Callable[[AsyncGenerator[bytes]], Awaitable[None]],
+    buffer_chunks: int = DEFAULT_BUFFER_CHUNKS,
+) -> None:
+    """
+    Feed a stream into a consumer through a bounded queue.
+    Reading and writing overlap, but the producer never runs more than
+    buffer_chunks ahead, so memory stays bounded when the consumer is slow.
+    """
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=buffer_chunks)
+
+    async def produce() -> None:
+        async for chunk in source:
+            await queue.put(chunk)
+        await queue.put(None)
+
+    async def consume() -> AsyncGenerator[bytes]:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            producer = group.create_task(produce())
+            await sink(consume())
+            # Stop reading if the consumer returned without draining the source.
+            _ = producer.cancel()
+    except ExceptionGroup as error:
+        # Surface the first failure as is, so error handlers still see it.
+        raise error.exceptions[0] from None
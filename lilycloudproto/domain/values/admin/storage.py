@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from pydantic import BaseModel
 
+from lilycloudproto.domain.values.sort import SortOrder
+
 
 class StorageType(str, Enum):
     LOCAL = "local"
@@ -32,6 +35,27 @@ CONFIG_MAP: dict[StorageType, type[StorageConfig]] = {
 
 def validate_config(
     storage_type: StorageType, config: StorageConfig | dict[str, str]
+) -> dict[str, str]:
+    if isinstance(config, dict):
+        # Raw configs are memoized, stored configs are validated repeatedly.
+        try:
+            items = frozenset(config.items())
+        except TypeError:
+            # Unhashable values (lists, dicts) cannot key the cache.
+            return _validate(storage_type, config)
+        return dict(_validate_items(storage_type, items))
+    return _validate(storage_type, config)
+
+
+@lru_cache(maxsize=1024)
+def _validate_items(
+    storage_type: StorageType, items: frozenset[tuple[str, str]]
+) -> tuple[tuple[str, str], ...]:
+    return tuple(_validate(storage_type, dict(items)).items())
+
+
+def _validate(
+    storage_type: StorageType, config: StorageConfig | dict[str, str]
 ) -> dict[str, str]:
     model = CONFIG_MAP.get(storage_type)
     if not model:
@@ -39,11 +63,6 @@ def validate_config(
     return model.model_validate(config).model_dump()
 
 
-class SortOrder(str, Enum):
-    ASC = "asc"
-    DESC = "desc"
-
-
 class SortBy(str, Enum):
     CREATED_AT = "created_at"
     UPDATED_AT = "updated_at"
@@ -52,7 +71,7 @@ class SortBy(str, Enum):
     ENABLED = "enabled"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListArgs:
     keyword: str | None
     type: StorageType | None
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from lilycloudproto.domain.driver import Base
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class TaskType(str, Enum):
@@ -32,12 +33,7 @@ class SortBy(str, Enum):
     UPDATED_AT = "updated"
 
 
-class SortOrder(str, Enum):
-    ASC = "asc"
-    DESC = "desc"
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListArgs:
     keyword: str | None
     user_id: int | None
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from lilycloudproto.domain.values.sort import SortOrder
+
 
 class Role(str, Enum):
     ADMIN = "admin"
@@ -14,12 +16,7 @@ class SortBy(str, Enum):
     UPDATED_AT = "updated"
 
 
-class SortOrder(str, Enum):
-    ASC = "asc"
-    DESC = "desc"
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListArgs:
     keyword: str | None = None
     role: Role | None = None
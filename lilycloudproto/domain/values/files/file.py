@@ -8,7 +8,7 @@ class Type(str, Enum):
     DIRECTORY = "directory"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class File:
     name: str
     path: str
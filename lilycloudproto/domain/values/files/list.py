@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 
-from lilycloudproto.domain.values.files.sort import SortBy, SortOrder
+from lilycloudproto.domain.values.files.sort import SortBy
+from lilycloudproto.domain.values.sort import SortOrder
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListArgs:
     path: str
     sort_by: SortBy = SortBy.NAME
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 
 from lilycloudproto.domain.values.files.file import Type
-from lilycloudproto.domain.values.files.sort import SortBy, SortOrder
+from lilycloudproto.domain.values.files.sort import SortBy
+from lilycloudproto.domain.values.sort import SortOrder
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchArgs:
     keyword: str
     path: str
@@ -1,6 +1,8 @@
 from enum import Enum
 from typing import Protocol
 
+from lilycloudproto.domain.values.sort import SortOrder
+
 
 class SortBy(str, Enum):
     NAME = "name"
@@ -11,12 +13,12 @@ class SortBy(str, Enum):
     TYPE = "type"
 
 
-class SortOrder(str, Enum):
-    ASC = "asc"
-    DESC = "desc"
+class SortArgs(Protocol):
+    @property
+    def sort_by(self) -> SortBy: ...
 
+    @property
+    def sort_order(self) -> SortOrder: ...
 
-class SortArgs(Protocol):
-    sort_by: SortBy
-    sort_order: SortOrder
-    dir_first: bool
+    @property
+    def dir_first(self) -> bool: ...
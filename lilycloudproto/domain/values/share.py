@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from lilycloudproto.domain.values.sort import SortOrder
+
 
 class Permission(str, Enum):
     READ = "read"
@@ -17,12 +19,7 @@ class SortBy(str, Enum):
     UPDATED_AT = "updated_at"
 
 
-class SortOrder(str, Enum):
-    ASC = "asc"
-    DESC = "desc"
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListArgs:
     keyword: str | None = None
     user_id: int | None = None
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from lilycloudproto.domain.values.files.file import Type
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class SortBy(str, Enum):
@@ -15,12 +16,7 @@ class SortBy(str, Enum):
     ACCESSED = "accessed"
 
 
-class SortOrder(str, Enum):
-    ASC = "asc"
-    DESC = "desc"
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ListArgs:
     keyword: str | None = None
     user_id: int | None = None
@@ -1,6 +1,11 @@
-from fastapi import FastAPI, Request, Response
-from fastapi.exceptions import HTTPException
+import json
+import logging
+
+from fastapi import FastAPI
 from sqlalchemy.exc import IntegrityError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
 
 
 class BadRequestError(Exception):
@@ -15,6 +20,12 @@ class AuthenticationError(Exception):
     pass
 
 
+class WebDAVUnauthorizedError(AuthenticationError):
+    """Raised when WebDAV Basic authentication fails (401 with a Basic challenge)."""
+
+    pass
+
+
 class NotFoundError(Exception):
     """Raised when a resource is not found."""
 
@@ -45,60 +56,120 @@ class TeapotError(Exception):
     pass
 
 
-# pyright: reportUnusedFunction=false
-def register_error_handlers(app: FastAPI) -> None:
-    @app.exception_handler(IntegrityError)
-    async def integrity_error_handler(
-        _request: Request, exception: IntegrityError
-    ) -> None:
-        raise HTTPException(status_code=400, detail=str(exception))
-
-    @app.exception_handler(BadRequestError)
-    async def bad_request_handler(
-        _request: Request, exception: BadRequestError
-    ) -> None:
-        raise HTTPException(status_code=400, detail=str(exception))
-
-    @app.exception_handler(AuthenticationError)
-    async def authentication_handler(
-        _request: Request, exception: AuthenticationError
-    ) -> None:
-        raise HTTPException(
-            status_code=401,
-            detail=str(exception),
-            headers={"WWW-Authenticate": "Bearer"},
+# Status code and extra headers for each domain exception.
+ERROR_RESPONSES: dict[type[Exception], tuple[int, list[tuple[bytes, bytes]]]] = {
+    IntegrityError: (400, []),
+    BadRequestError: (400, []),
+    AuthenticationError: (401, [(b"www-authenticate", b"Bearer")]),
+    NotFoundError: (404, []),
+    ConflictError: (409, []),
+    TeapotError: (418, []),
+    UnprocessableEntityError: (422, []),
+    InternalServerError: (500, []),
+}
+
+# ERROR_RESPONSES entries resolved for concrete exception types, with the
+# content type prepended, filled in on first use.
+_resolved_responses: dict[
+    type[Exception], tuple[int, list[tuple[bytes, bytes]]] | None
+] = {}
+
+# WebDAV clients expect a plain-text Basic challenge rather than JSON.
+WEBDAV_UNAUTHORIZED_HEADERS = [
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"www-authenticate", b'Basic realm="LilyCloud WebDAV"'),
+]
+
+
+class ErrorMiddleware:
+    """
+    Turn exceptions raised by endpoints into error responses.
+    A plain ASGI middleware, so failed requests skip Starlette's handler
+    lookup and HTTPException round-trip.
+    """
+
+    app: ASGIApp
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exception:
+            # Nothing can be sent once a (streaming) response has started.
+            if response_started:
+                raise
+            await self._send_error(send, exception)
+
+    async def _send_error(self, send: Send, exception: Exception) -> None:
+        if isinstance(exception, WebDAVUnauthorizedError):
+            await _send_response(
+                send, 401, WEBDAV_UNAUTHORIZED_HEADERS, b"Unauthorized"
+            )
+            return
+
+        error_response = _lookup_error_response(type(exception))
+        if error_response is not None:
+            status, headers = error_response
+            body = json.dumps(
+                {"detail": str(exception)},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode()
+            await _send_response(send, status, headers, body)
+            return
+
+        logger.exception("Unhandled error.", exc_info=exception)
+        await _send_response(
+            send,
+            500,
+            [(b"content-type", b"application/json")],
+            b'{"detail":"Internal Server Error"}',
         )
 
-    @app.exception_handler(NotFoundError)
-    async def not_found_handler(_request: Request, exception: NotFoundError) -> None:
-        raise HTTPException(status_code=404, detail=str(exception))
-
-    @app.exception_handler(ConflictError)
-    async def conflict_handler(_request: Request, exception: ConflictError) -> None:
-        raise HTTPException(status_code=409, detail=str(exception))
-
-    @app.exception_handler(TeapotError)
-    async def teapot_handler(_request: Request, exception: TeapotError) -> None:
-        raise HTTPException(status_code=418, detail=str(exception))
-
-    @app.exception_handler(UnprocessableEntityError)
-    async def unprocessable_entity_handler(
-        _request: Request, exception: UnprocessableEntityError
-    ) -> None:
-        raise HTTPException(status_code=422, detail=str(exception))
-
-    @app.exception_handler(InternalServerError)
-    async def internal_server_error_handler(
-        _request: Request, exception: InternalServerError
-    ) -> None:
-        raise HTTPException(status_code=500, detail=str(exception))
-
-    @app.exception_handler(Exception)
-    async def global_exception_handler(request: Request, exc: Exception) -> Response:
-        if str(exc) == "Unauthorized" and request.url.path.startswith("/webdav"):
-            return Response(
-                status_code=401,
-                headers={"WWW-Authenticate": 'Basic realm="LilyCloud WebDAV"'},
-                content="Unauthorized",
-            )
-        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+def _lookup_error_response(
+    error_type: type[Exception],
+) -> tuple[int, list[tuple[bytes, bytes]]] | None:
+    """Resolve the nearest mapped base class once per exception type."""
+    if error_type not in _resolved_responses:
+        _resolved_responses[error_type] = None
+        for base in error_type.__mro__:
+            if base in ERROR_RESPONSES:
+                status, headers = ERROR_RESPONSES[base]
+                _resolved_responses[error_type] = (
+                    status,
+                    [(b"content-type", b"application/json"), *headers],
+                )
+                break
+    return _resolved_responses[error_type]
+
+
+async def _send_response(
+    send: Send, status: int, headers: list[tuple[bytes, bytes]], body: bytes
+) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-length", str(len(body)).encode()), *headers],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def register_error_handlers(app: FastAPI) -> None:
+    app.add_middleware(ErrorMiddleware)
@@ -1,15 +1,21 @@
 import asyncio
+import ctypes
+import errno
 import mimetypes
 import os
 import shutil
-from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+import sys
+import threading
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import override
+from functools import partial
+from operator import attrgetter
+from stat import S_IMODE, S_ISDIR, S_ISLNK, S_ISREG
+from typing import Any, override
 
-import aiofiles
-import magic
-
-from lilycloudproto.domain.driver import Base, Driver
+from lilycloudproto.domain.driver import DEFAULT_CHUNK_SIZE, Base, Driver
 from lilycloudproto.domain.entities.storage import Storage
 from lilycloudproto.domain.values.admin.storage import LocalConfig, StorageType
 from lilycloudproto.domain.values.files.file import File, Type
@@ -23,11 +29,122 @@ from lilycloudproto.error import (
     NotFoundError,
 )
 
+# Buffered upload bytes written per worker thread call.
+WRITE_BATCH_SIZE = 1024 * 1024
+
+# Streaming reads and writes run here rather than in the loop's default
+# executor, so long transfers do not queue behind unrelated blocking work.
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="local-io")
+
+# Recursive searches scan directories concurrently here; scandir and stat
+# release the GIL, so scans overlap their waits on slow or remote filesystems.
+# Sized like ThreadPoolExecutor's default, with a lower cap.
+SEARCH_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=SEARCH_WORKERS, thread_name_prefix="local-search"
+)
+
+# One scanned directory: its matches and the searches of its subdirectories.
+SearchShard = tuple[list[File], list["Future[SearchShard]"]]
+
+# Directories can be opened without following links and scanned by descriptor.
+SCANDIR_BY_FD = (
+    os.scandir in os.supports_fd
+    and hasattr(os, "O_DIRECTORY")
+    and hasattr(os, "O_NOFOLLOW")
+)
+
+# Bytes requested per copy_file_range call; the kernel may copy less.
+COPY_RANGE_SIZE = 1024 * 1024 * 1024
+
+# copy_file_range errors meaning "not supported here", e.g. across filesystems.
+COPY_RANGE_FALLBACK_ERRORS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+)
+
+# Directory trees can be copied by descriptor, with files opened relative to
+# their already open parent directories and copied by copy_file_range.
+COPY_TREE_BY_FD = (
+    SCANDIR_BY_FD
+    and hasattr(os, "copy_file_range")
+    and os.open in os.supports_dir_fd
+    and os.mkdir in os.supports_dir_fd
+    and os.utime in os.supports_fd
+)
+
+# renameat2(2) arguments: resolve paths from the working directory and fail
+# with EEXIST instead of replacing the destination.
+AT_FDCWD = -100
+RENAME_NOREPLACE = 1
+
+# renameat2 errors meaning "cannot rename this way", e.g. across filesystems.
+RENAME_FALLBACK_ERRORS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL})
+
+
+def _load_renameat2() -> Any:
+    if sys.platform != "linux":
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+    renameat2 = getattr(libc, "renameat2", None)  # glibc 2.28 and later.
+    if renameat2 is not None:
+        renameat2.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint,
+        ]
+        renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+_renameat2 = _load_renameat2()
+
+
+def _rename_noreplace(src_path: str, dst_path: str) -> bool:
+    """
+    Atomically rename a path unless the destination exists, in one system call.
+    Returns False when renameat2 cannot be used here, so the caller falls back
+    to shutil.move; other failures raise OSError (e.g. FileExistsError).
+    """
+    if _renameat2 is None:
+        return False
+    result = _renameat2(
+        AT_FDCWD,
+        os.fsencode(src_path),
+        AT_FDCWD,
+        os.fsencode(dst_path),
+        RENAME_NOREPLACE,
+    )
+    if result == 0:
+        return True
+    code = ctypes.get_errno()
+    if code in RENAME_FALLBACK_ERRORS:
+        return False
+    raise OSError(code, os.strerror(code), src_path, None, dst_path)
+
+
+# C-level attribute getters are cheaper sort keys than Python lambdas.
+SORT_KEYS: dict[str, Callable[[File], Any]] = {
+    "name": attrgetter("name"),
+    "size": attrgetter("size"),
+    "created": attrgetter("created_at"),
+    "modified": attrgetter("modified_at"),
+    "accessed": attrgetter("accessed_at"),
+    "type": attrgetter("mime_type"),
+}
+
 
 class LocalDriver(Driver):
     root_path: str
     trash_path: str
     base: Base
+    # Roots with a trailing separator, for path containment checks.
+    _root_prefix: str
+    _trash_prefix: str
 
     def __init__(self, storage: Storage, base: Base = Base.REGULAR):
         super().__init__(storage)
@@ -43,6 +160,8 @@ class LocalDriver(Driver):
         self.root_path = os.path.abspath(config.root_path)
         self.trash_path = os.path.abspath(config.trash_path)
         self.base = base
+        self._root_prefix = os.path.join(self.root_path, "")
+        self._trash_prefix = os.path.join(self.trash_path, "")
 
         if not os.path.exists(self.root_path):
             os.makedirs(self.root_path, exist_ok=True)
@@ -51,33 +170,41 @@ class LocalDriver(Driver):
 
     @override
     def list_dir(self, args: ListArgs) -> list[File]:
-        files: list[File] = []
-        physical_path = self._get_physical_path(args.path)
-        print(physical_path)
-        self._validate_directory(physical_path)
+        files = list(self.iter_dir(args.path))
+        return self._sort_files(files, args)
 
-        for entry in os.scandir(physical_path):
-            if not entry.is_junction() and not entry.is_symlink():
-                logical_path = os.path.join(args.path, entry.name).replace("\\", "/")
-                files.append(self._entry_to_file(entry, logical_path))
+    @override
+    def iter_dir(self, path: str) -> Iterator[File]:
+        physical_path = self._get_physical_path(path)
 
-        return self._sort_files(files, args)
+        # Entry names never contain a separator, so only the prefix needs one.
+        prefix = os.path.join(path, "").replace("\\", "/")
+        mime_types: dict[str, str | None] = {}
+        with self._scan_directory(physical_path) as entries:
+            for entry in entries:
+                if not entry.is_junction() and not entry.is_symlink():
+                    logical_path = prefix + entry.name
+                    yield self._entry_to_file(entry, logical_path, mime_types)
 
     @override
     def info(self, path: str) -> File:
         physical_path = self._get_physical_path(path)
 
-        if not self._validate_path(physical_path):
+        stat = self._lstat(physical_path)
+        if stat is None:
             raise NotFoundError(f"File not found at '{path}'.")
+        return self._stat_to_file(path, physical_path, stat)
 
-        stat = os.stat(physical_path)
+    def _stat_to_file(
+        self, path: str, physical_path: str, stat: os.stat_result
+    ) -> File:
         name = os.path.basename(physical_path)
-        mime_type = self._get_mime_type(physical_path)
+        mime_type = self._get_mime_type(physical_path, stat.st_mode)
 
         return File(
             name=name,
             path=path,
-            type=Type.DIRECTORY if os.path.isdir(physical_path) else Type.FILE,
+            type=Type.DIRECTORY if S_ISDIR(stat.st_mode) else Type.FILE,
             size=stat.st_size,
             mime_type=mime_type,
             created_at=datetime.fromtimestamp(stat.st_ctime),
@@ -90,19 +217,49 @@ class LocalDriver(Driver):
         physical_path = self._get_physical_path(args.path)
         self._validate_directory(physical_path)
 
+        # Lower-case the keyword once instead of once per scanned entry.
+        keyword = args.keyword.lower() if args.keyword else None
+        # Guesses only depend on the name, so all scans can share them.
+        mime_types: dict[str, str | None] = {}
+        if not args.recursive:
+            matches, _ = self._search_directory(
+                physical_path, args, keyword, mime_types
+            )
+            return self._sort_files(matches, args)
+
+        stop = threading.Event()
+
+        def search_subtree(path: str) -> SearchShard:
+            # Workers queue subdirectories themselves, so idle threads pick
+            # them up as soon as they are found.
+            if stop.is_set():
+                return [], []
+            try:
+                matches, subdirs = self._search_directory(
+                    path, args, keyword, mime_types
+                )
+            except (NotFoundError, OSError):
+                if path == physical_path:
+                    raise
+                # Like os.walk, skip subdirectories that vanish or cannot be read.
+                return [], []
+            subtrees = [
+                SEARCH_EXECUTOR.submit(search_subtree, subdir) for subdir in subdirs
+            ]
+            return matches, subtrees
+
+        # Shards are merged depth-first in scan order, so the result is the
+        # same as a serial walk's, whatever order the scans finish in.
         result: list[File] = []
-        for entry in self._walk_entries(physical_path, args.recursive):
-            if (
-                not entry.is_symlink()
-                and not entry.is_junction()
-                and self._match_entry(entry, args)
-            ):
-                try:
-                    rel_path = os.path.relpath(entry.path, self.root_path)
-                except ValueError:
-                    continue
-                logical_path = rel_path.replace("\\", "/")
-                result.append(self._entry_to_file(entry, logical_path))
+        pending = [SEARCH_EXECUTOR.submit(search_subtree, physical_path)]
+        try:
+            while pending:
+                matches, subtrees = pending.pop().result()
+                result.extend(matches)
+                pending.extend(reversed(subtrees))
+        finally:
+            # On failure, keep queued scans from walking the rest of the tree.
+            stop.set()
         return self._sort_files(result, args)
 
     @override
@@ -130,34 +287,34 @@ class LocalDriver(Driver):
         file_names: list[str],
         progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
     ) -> None:
-        total = len(file_names)
-
         phys_src_dir = self._get_physical_path(src_dir)
         phys_dst_dir = self._get_physical_path(dst_dir)
 
         self._validate_directory(phys_src_dir)
         self._validate_directory(phys_dst_dir)
 
-        for index, name in enumerate(file_names, 1):
-            src_path = os.path.join(phys_src_dir, name)
-            dst_path = os.path.join(phys_dst_dir, name)
+        src_prefix = os.path.join(phys_src_dir, "")
+        dst_prefix = os.path.join(phys_dst_dir, "")
+        operations: list[Callable[[], None]] = []
+        for name in file_names:
+            src_path = self._join_name(src_prefix, name)
+            dst_path = self._join_name(dst_prefix, name)
 
-            if not self._validate_path(src_path):
+            src_stat = self._lstat(src_path)
+            if src_stat is None:
                 continue
             if os.path.exists(dst_path):
                 raise ConflictError(f"Destination '{name}' already exists.")
-            try:
-                if os.path.isdir(src_path):
-                    _ = shutil.copytree(src_path, dst_path, symlinks=False)
-                else:
-                    _ = shutil.copy2(src_path, dst_path)
-            except Exception as error:
-                raise InternalServerError(
-                    f"Failed to copy '{name}': {error}"
-                ) from error
-            if progress_callback:
-                await progress_callback(index, total)
-            await asyncio.sleep(0)
+            operations.append(
+                partial(
+                    self._copy_entry,
+                    name,
+                    src_path,
+                    dst_path,
+                    S_ISDIR(src_stat.st_mode),
+                )
+            )
+        await self._run_batch(operations, progress_callback)
 
     @override
     async def move(
@@ -167,29 +324,24 @@ class LocalDriver(Driver):
         file_names: list[str],
         progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
     ) -> None:
-        total = len(file_names)
         phys_src_dir = self._get_physical_path(src_dir)
         phys_dst_dir = self._get_physical_path(dst_dir)
 
         self._validate_directory(phys_src_dir)
         self._validate_directory(phys_dst_dir)
 
-        for index, name in enumerate(file_names, 1):
-            src_path = os.path.join(phys_src_dir, name)
-            dst_path = os.path.join(phys_dst_dir, name)
+        src_prefix = os.path.join(phys_src_dir, "")
+        dst_prefix = os.path.join(phys_dst_dir, "")
+        operations: list[Callable[[], None]] = []
+        for name in file_names:
+            src_path = self._join_name(src_prefix, name)
+            dst_path = self._join_name(dst_prefix, name)
             if not self._validate_path(src_path):
                 continue
             if os.path.exists(dst_path):
                 raise ConflictError(f"Destination '{name}' already exists.")
-            try:
-                _ = shutil.move(src_path, dst_path)
-            except Exception as error:
-                raise InternalServerError(
-                    f"Failed to move '{name}': {error}"
-                ) from error
-            if progress_callback:
-                await progress_callback(index, total)
-            await asyncio.sleep(0)
+            operations.append(partial(self._move_entry, name, src_path, dst_path))
+        await self._run_batch(operations, progress_callback)
 
     @override
     async def delete(
@@ -198,36 +350,47 @@ class LocalDriver(Driver):
         file_names: list[str],
         progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
     ) -> None:
-        total = len(file_names)
         phys_dir = self._get_physical_path(dir)
         self._validate_directory(phys_dir)
 
-        for index, name in enumerate(file_names, 1):
-            path = os.path.join(phys_dir, name)
-            if not self._validate_path(path):
+        prefix = os.path.join(phys_dir, "")
+        operations: list[Callable[[], None]] = []
+        for name in file_names:
+            path = self._join_name(prefix, name)
+            stat = self._lstat(path)
+            if stat is None:
                 continue
-            try:
-                if os.path.isdir(path):
-                    shutil.rmtree(path)
-                else:
-                    os.remove(path)
-            except Exception as error:
-                raise InternalServerError(
-                    f"Failed to delete '{name}': {error}"
-                ) from error
-            if progress_callback:
-                await progress_callback(index, total)
-            await asyncio.sleep(0)
+            operations.append(
+                partial(self._delete_entry, name, path, S_ISDIR(stat.st_mode))
+            )
+        await self._run_batch(operations, progress_callback)
 
     @override
     async def write(self, path: str, content_stream: AsyncGenerator[bytes]) -> None:
         physical_path = self._get_physical_path(path)
 
         os.makedirs(os.path.dirname(physical_path), exist_ok=True)
+        loop = asyncio.get_running_loop()
         try:
-            async with aiofiles.open(physical_path, "wb") as f:
+            file = await loop.run_in_executor(IO_EXECUTOR, open, physical_path, "wb")
+            try:
+                # Request bodies arrive in small chunks; hand them to a worker
+                # thread in batches instead of one thread hop per chunk.
+                pending: list[bytes] = []
+                pending_size = 0
                 async for chunk in content_stream:
-                    _ = await f.write(chunk)
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    if pending_size >= WRITE_BATCH_SIZE:
+                        await loop.run_in_executor(
+                            IO_EXECUTOR, file.writelines, pending
+                        )
+                        pending = []
+                        pending_size = 0
+                if pending:
+                    await loop.run_in_executor(IO_EXECUTOR, file.writelines, pending)
+            finally:
+                await loop.run_in_executor(IO_EXECUTOR, file.close)
         except Exception as error:
             raise InternalServerError(
                 f"Failed to write stream to '{path}': {error}"
@@ -235,19 +398,61 @@ class LocalDriver(Driver):
 
     @override
     async def read(
-        self, path: str, chunk_size: int = 1024 * 64
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
     ) -> AsyncGenerator[bytes]:
         physical_path = self._get_physical_path(path)
         if not os.path.exists(physical_path):
             raise FileNotFoundError(f"File not found: {path}")
-        async with aiofiles.open(physical_path, "rb") as f:
-            while chunk := await f.read(chunk_size):
-                yield chunk
+        async for chunk in self._read_physical(physical_path, chunk_size):
+            yield chunk
+
+    @override
+    async def read_view(
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncGenerator[memoryview]:
+        physical_path = self._get_physical_path(path)
+        if not os.path.exists(physical_path):
+            raise FileNotFoundError(f"File not found: {path}")
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        loop = asyncio.get_running_loop()
+        fd = await loop.run_in_executor(
+            IO_EXECUTOR, os.open, physical_path, os.O_RDONLY
+        )
+        try:
+            while size := await loop.run_in_executor(
+                IO_EXECUTOR, os.readv, fd, [buffer]
+            ):
+                yield view[:size]
+        finally:
+            os.close(fd)
+
+    @override
+    async def open_read(
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> tuple[File, AsyncGenerator[bytes] | str]:
+        # One lstat answers both the info and whether a local path can be used.
+        physical_path = self._get_physical_path(path)
+        stat = self._lstat(physical_path)
+        if stat is None:
+            raise NotFoundError(f"File not found at '{path}'.")
+        file = self._stat_to_file(path, physical_path, stat)
+        if S_ISREG(stat.st_mode):
+            return file, physical_path
+        return file, self._read_physical(physical_path, chunk_size)
 
     @override
     async def get_link(self, path: str) -> str | None:
         return None
 
+    @override
+    def get_local_path(self, path: str) -> str | None:
+        physical_path = self._get_physical_path(path)
+        stat = self._lstat(physical_path)
+        if stat is None:
+            raise NotFoundError(f"File not found at '{path}'.")
+        return physical_path if S_ISREG(stat.st_mode) else None
+
     @override
     async def rename(self, src_path: str, dst_path: str) -> None:
         phys_src_path = self._get_physical_path(src_path)
@@ -256,6 +461,17 @@ class LocalDriver(Driver):
         if not self._validate_path(phys_src_path):
             raise NotFoundError(f"Source file not found at '{src_path}'.")
 
+        # renameat2 checks the destination itself, atomically.
+        try:
+            if _rename_noreplace(phys_src_path, phys_dst_path):
+                return
+        except FileExistsError as error:
+            raise ConflictError(f"Destination '{dst_path}' already exists.") from error
+        except FileNotFoundError as error:
+            raise NotFoundError("Destination directory does not exist.") from error
+        except OSError as error:
+            raise InternalServerError(f"Failed to rename: {error}") from error
+
         dst_dir = os.path.dirname(phys_dst_path)
         if not os.path.exists(dst_dir):
             raise NotFoundError("Destination directory does not exist.")
@@ -278,31 +494,23 @@ class LocalDriver(Driver):
         """
         Move files from dir to trash_path.
         """
-        total = len(file_names)
         phys_src_dir = self._get_physical_path(dir)
         self._validate_directory(phys_src_dir)
 
-        for index, name in enumerate(file_names, 1):
-            src_path = os.path.join(phys_src_dir, name)
+        src_prefix = os.path.join(phys_src_dir, "")
+        operations: list[Callable[[], None]] = []
+        for name in file_names:
+            src_path = self._join_name(src_prefix, name)
             if not self._validate_path(src_path):
                 continue
 
             # Move to trash root.
-            trash_dst = os.path.join(self.trash_path, name)
+            trash_dst = self._join_name(self._trash_prefix, name)
             # Ensure no overwrite in trash.
             if os.path.exists(trash_dst):
                 raise ConflictError(f"Trash already contains a file named '{name}'.")
-
-            try:
-                _ = shutil.move(src_path, trash_dst)
-            except Exception as error:
-                raise InternalServerError(
-                    f"Failed to move '{name}' to trash: {error}."
-                ) from error
-
-            if progress_callback:
-                await progress_callback(index, total)
-            await asyncio.sleep(0)
+            operations.append(partial(self._trash_entry, name, src_path, trash_dst))
+        await self._run_batch(operations, progress_callback)
 
     @override
     async def restore(
@@ -316,29 +524,200 @@ class LocalDriver(Driver):
         """
         if len(src_paths) != len(dst_paths):
             raise ValueError("src_paths and dst_paths must have the same length.")
-        total = len(src_paths)
 
-        for index, (src_rel, dst_rel) in enumerate(
-            zip(src_paths, dst_paths, strict=True), 1
-        ):
+        operations: list[Callable[[], None]] = []
+        parents: set[str] = set()
+        for src_rel, dst_rel in zip(src_paths, dst_paths, strict=True):
             trash_src = os.path.join(self.trash_path, src_rel.lstrip("/\\"))
             restore_dst = self._get_physical_path(dst_rel)
 
             if not self._validate_path(trash_src):
                 continue
+            parents.add(os.path.dirname(restore_dst))
+            operations.append(
+                partial(self._restore_entry, src_rel, dst_rel, trash_src, restore_dst)
+            )
+        # Each destination directory is created once, not once per item in it.
+        await asyncio.to_thread(self._make_directories, sorted(parents))
+        await self._run_batch(operations, progress_callback)
 
-            os.makedirs(os.path.dirname(restore_dst), exist_ok=True)
+    async def _read_physical(
+        self, physical_path: str, chunk_size: int
+    ) -> AsyncGenerator[bytes]:
+        loop = asyncio.get_running_loop()
+        fd = await loop.run_in_executor(
+            IO_EXECUTOR, os.open, physical_path, os.O_RDONLY
+        )
+        try:
+            while chunk := await loop.run_in_executor(
+                IO_EXECUTOR, os.read, fd, chunk_size
+            ):
+                yield chunk
+        finally:
+            os.close(fd)
 
+    def _copy_entry(
+        self, name: str, src_path: str, dst_path: str, is_dir: bool
+    ) -> None:
+        try:
+            if is_dir and COPY_TREE_BY_FD:
+                self._copy_tree(src_path, dst_path)
+            elif is_dir:
+                _ = shutil.copytree(
+                    src_path,
+                    dst_path,
+                    symlinks=False,
+                    copy_function=self._copy_file,
+                )
+            else:
+                _ = self._copy_file(src_path, dst_path)
+        except Exception as error:
+            raise InternalServerError(f"Failed to copy '{name}': {error}") from error
+
+    def _copy_file(self, src_path: str, dst_path: str) -> str:
+        """
+        Copy a file and its metadata like shutil.copy2.
+        The data never leaves the kernel where copy_file_range is available;
+        elsewhere this is shutil.copy2 itself.
+        """
+        if not hasattr(os, "copy_file_range"):
+            return shutil.copy2(src_path, dst_path)
+        with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+            self._copy_data(src.fileno(), dst.fileno())
+        shutil.copystat(src_path, dst_path)
+        return dst_path
+
+    def _copy_data(self, src_fd: int, dst_fd: int) -> None:
+        """
+        Copy the rest of src_fd into dst_fd inside the kernel.
+        copy_file_range can clone or copy server-side; where it is unsupported
+        (e.g. across filesystems) the copy restarts with sendfile instead.
+        """
+        try:
+            while os.copy_file_range(src_fd, dst_fd, COPY_RANGE_SIZE):
+                pass
+        except OSError as error:
+            if error.errno not in COPY_RANGE_FALLBACK_ERRORS:
+                raise
+            _ = os.lseek(src_fd, 0, os.SEEK_SET)
+            _ = os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+            while os.sendfile(dst_fd, src_fd, None, COPY_RANGE_SIZE):
+                pass
+
+    def _copy_tree(self, src_path: str, dst_path: str) -> None:
+        """
+        Copy a directory tree and its metadata like shutil.copytree.
+        Each directory is opened once and scanned by descriptor, and its files
+        are opened relative to it instead of re-resolving the full path for
+        every file; symlinks are followed, as copytree does by default.
+        """
+        os.mkdir(dst_path)
+        directories = [(dst_path, os.stat(src_path))]
+        pending = [(src_path, dst_path)]
+        flags = os.O_RDONLY | os.O_DIRECTORY
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            src_dir_fd = os.open(src_dir, flags)
+            try:
+                dst_dir_fd = os.open(dst_dir, flags)
+                try:
+                    with os.scandir(src_dir_fd) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                os.mkdir(entry.name, dir_fd=dst_dir_fd)
+                                dst_subdir = os.path.join(dst_dir, entry.name)
+                                directories.append((dst_subdir, entry.stat()))
+                                pending.append(
+                                    (os.path.join(src_dir, entry.name), dst_subdir)
+                                )
+                            elif entry.is_file():
+                                self._copy_file_at(entry.name, src_dir_fd, dst_dir_fd)
+                            else:
+                                raise shutil.SpecialFileError(
+                                    f"'{os.path.join(src_dir, entry.name)}' "
+                                    "is not a regular file or directory"
+                                )
+                finally:
+                    os.close(dst_dir_fd)
+            finally:
+                os.close(src_dir_fd)
+
+        # Copying contents touches directory times, so they are restored last.
+        for path, stat in reversed(directories):
+            os.chmod(path, S_IMODE(stat.st_mode))
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def _copy_file_at(self, name: str, src_dir_fd: int, dst_dir_fd: int) -> None:
+        src_fd = os.open(name, os.O_RDONLY, dir_fd=src_dir_fd)
+        try:
+            stat = os.fstat(src_fd)
+            dst_fd = os.open(
+                name,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                S_IMODE(stat.st_mode),
+                dir_fd=dst_dir_fd,
+            )
             try:
-                _ = shutil.move(trash_src, restore_dst)
-            except Exception as error:
-                raise InternalServerError(
-                    f"Failed to restore '{src_rel}' to '{dst_rel}': {error}"
-                ) from error
+                self._copy_data(src_fd, dst_fd)
+                os.fchmod(dst_fd, S_IMODE(stat.st_mode))
+                os.utime(dst_fd, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    def _move_entry(self, name: str, src_path: str, dst_path: str) -> None:
+        try:
+            if not _rename_noreplace(src_path, dst_path):
+                _ = shutil.move(src_path, dst_path)
+        except Exception as error:
+            raise InternalServerError(f"Failed to move '{name}': {error}") from error
+
+    def _trash_entry(self, name: str, src_path: str, trash_dst: str) -> None:
+        try:
+            if not _rename_noreplace(src_path, trash_dst):
+                _ = shutil.move(src_path, trash_dst)
+        except Exception as error:
+            raise InternalServerError(
+                f"Failed to move '{name}' to trash: {error}."
+            ) from error
+
+    def _restore_entry(
+        self, src_rel: str, dst_rel: str, trash_src: str, restore_dst: str
+    ) -> None:
+        try:
+            if _rename_noreplace(trash_src, restore_dst):
+                return
+        except FileExistsError as error:
+            raise ConflictError(f"Destination '{dst_rel}' already exists.") from error
+        except OSError as error:
+            raise InternalServerError(
+                f"Failed to restore '{src_rel}' to '{dst_rel}': {error}"
+            ) from error
+
+        if os.path.exists(restore_dst):
+            raise ConflictError(f"Destination '{dst_rel}' already exists.")
 
-            if progress_callback:
-                await progress_callback(index, total)
-            await asyncio.sleep(0)
+        try:
+            _ = shutil.move(trash_src, restore_dst)
+        except Exception as error:
+            raise InternalServerError(
+                f"Failed to restore '{src_rel}' to '{dst_rel}': {error}"
+            ) from error
+
+    def _make_directories(self, paths: list[str]) -> None:
+        for path in paths:
+            os.makedirs(path, exist_ok=True)
+
+    def _delete_entry(self, name: str, path: str, is_dir: bool) -> None:
+        try:
+            if is_dir:
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except Exception as error:
+            raise InternalServerError(f"Failed to delete '{name}': {error}") from error
 
     def _get_physical_path(self, logical_path: str) -> str:
         logical_path = logical_path.lstrip("/\\")
@@ -354,56 +733,152 @@ class LocalDriver(Driver):
             logical_path = logical_path[len(mount_path) :].lstrip("/\\")
 
         if self.base == Base.REGULAR:
-            root = self.root_path
+            root, root_prefix = self.root_path, self._root_prefix
         elif self.base == Base.TRASH:
-            root = self.trash_path
+            root, root_prefix = self.trash_path, self._trash_prefix
         elif self.base == Base.SHARE:
             # Update when share functionality is implemented.
             if self.share_path is None:
                 raise ValueError("share_path must be provided when base is SHARE.")
-            root = os.path.join(self.root_path, self.share_path)
+            root = os.path.normpath(os.path.join(self.root_path, self.share_path))
+            root_prefix = os.path.join(root, "")
         else:
             raise ValueError(f"Unknown base: {self.base}")
         physical_path = os.path.join(root, logical_path)
         physical_path = os.path.normpath(physical_path)
-        if not physical_path.startswith(root):
+        # Compare against root plus a separator, so "/data" does not admit
+        # its sibling "/data2".
+        if physical_path != root and not physical_path.startswith(root_prefix):
             raise BadRequestError("Path traversal detected.")
         return physical_path
 
     def _validate_directory(self, dir: str) -> None:
-        dir = os.path.normpath(dir)
-        if not os.path.exists(dir) or os.path.islink(dir) or os.path.isjunction(dir):
+        stat = self._lstat(dir)
+        if stat is None:
             raise NotFoundError("Directory not found.")
-        if not os.path.isdir(dir):
+        if not S_ISDIR(stat.st_mode):
             raise BadRequestError("Path is not a directory.")
 
+    @contextmanager
+    def _scan_directory(self, dir: str) -> Generator[Iterator[os.DirEntry[str]]]:
+        """
+        Scan a directory, rejecting symlinks and non-directories.
+        Where supported, the directory is opened with O_NOFOLLOW and scanned
+        by descriptor, so validation costs no system calls of its own; entry
+        paths are then bare names.
+        """
+        if not SCANDIR_BY_FD:
+            self._validate_directory(dir)
+            with os.scandir(dir) as entries:
+                yield entries
+            return
+
+        try:
+            fd = os.open(dir, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+        except FileNotFoundError as error:
+            raise NotFoundError("Directory not found.") from error
+        except OSError:
+            # Symlinks and files both fail here; lstat tells them apart.
+            self._validate_directory(dir)
+            raise
+        try:
+            with os.scandir(fd) as entries:
+                yield entries
+        finally:
+            os.close(fd)
+
     def _validate_path(self, file: str) -> bool:
-        file = os.path.normpath(file)
-        return (
-            os.path.exists(file)
-            and not os.path.islink(file)
-            and not os.path.isjunction(file)
-        )
+        return self._lstat(file) is not None
+
+    def _join_name(self, prefix: str, name: str) -> str:
+        """
+        Append a file name to a directory prefix ending with a separator.
+        Names come straight from requests, so anything but a single path
+        component is rejected rather than allowed to leave the directory.
+        """
+        if (
+            not name
+            or name in (".", "..")
+            or "/" in name
+            or os.sep in name
+            or "\0" in name
+        ):
+            raise BadRequestError(f"Invalid file name '{name}'.")
+        return prefix + name
 
-    def _get_mime_type(self, path: str) -> str:
+    def _lstat(self, path: str) -> os.stat_result | None:
+        """
+        Stat a path with a single lstat call.
+        Returns None if it does not exist or is a symlink or junction, so
+        callers can branch on st_mode instead of stat-ing again.
+        """
+        path = os.path.normpath(path)
+        try:
+            stat = os.lstat(path)
+        except OSError:
+            return None
+        # isjunction only needs a system call on Windows.
+        if S_ISLNK(stat.st_mode) or os.path.isjunction(path):
+            return None
+        return stat
+
+    def _get_mime_type(self, path: str, mode: int) -> str:
+        # Callers pass the st_mode they already have to save a stat call.
+        if S_ISDIR(mode):
+            return "inode/directory"
         mime_type, _ = mimetypes.guess_type(path)
         if mime_type:
             return mime_type
-        if os.path.isfile(path):
+        if S_ISREG(mode):
+            # Loading libmagic is deferred until an extension is not recognized.
+            import magic  # noqa: PLC0415
+
             return str(
                 magic.from_file(  # pyright: ignore[reportUnknownMemberType]
                     path, mime=True
                 )
             )
-        return "inode/directory"
+        return "application/octet-stream"
+
+    def _guess_mime_type(
+        self, name: str, is_dir: bool, mime_types: dict[str, str | None]
+    ) -> str:
+        """
+        Guess a MIME type from the file name alone, for listings.
+        Guesses only depend on the name's extension, so they are memoized per
+        lower-cased extension in mime_types for the duration of one listing;
+        unrecognized files are reported as octet streams instead of being
+        sniffed.
+        """
+        if is_dir:
+            return "inode/directory"
+        suffix = os.path.splitext(name)[1].lower()
+        # Dotfiles have no extension, and behind an encoding suffix (.gz) the
+        # type comes from the inner extension, so neither can share a guess.
+        if not suffix or suffix in mimetypes.encodings_map:
+            mime_type, _ = mimetypes.guess_type(name)
+        elif suffix in mime_types:
+            mime_type = mime_types[suffix]
+        else:
+            mime_type, _ = mimetypes.guess_type(name)
+            mime_types[suffix] = mime_type
+        return mime_type or "application/octet-stream"
 
-    def _entry_to_file(self, entry: os.DirEntry[str], logical_path: str) -> File:
-        stat = entry.stat()
-        mime_type = self._get_mime_type(entry.path)
+    def _entry_to_file(
+        self,
+        entry: os.DirEntry[str],
+        logical_path: str,
+        mime_types: dict[str, str | None],
+    ) -> File:
+        # Symlinks are filtered out already, and the type bits of this one
+        # cached stat answer everything else the File needs.
+        stat = entry.stat(follow_symlinks=False)
+        is_dir = S_ISDIR(stat.st_mode)
+        mime_type = self._guess_mime_type(entry.name, is_dir, mime_types)
         return File(
             name=entry.name,
             path=logical_path,
-            type=Type.DIRECTORY if entry.is_dir() else Type.FILE,
+            type=Type.DIRECTORY if is_dir else Type.FILE,
             size=stat.st_size,
             mime_type=mime_type,
             created_at=datetime.fromtimestamp(stat.st_ctime),
@@ -411,44 +886,107 @@ class LocalDriver(Driver):
             accessed_at=datetime.fromtimestamp(stat.st_atime),
         )
 
+    def _search_directory(
+        self,
+        path: str,
+        args: SearchArgs,
+        keyword: str | None,
+        mime_types: dict[str, str | None],
+    ) -> tuple[list[File], list[str]]:
+        """
+        Collect the matching entries of one directory, and its subdirectories.
+        Safe to run on several threads at once; concurrent updates of the
+        shared mime_types memo at worst repeat a guess.
+        """
+        # Entries share their directory's logical prefix, so it is built once.
+        try:
+            rel_dir: str | None = os.path.relpath(path, self.root_path)
+        except ValueError:
+            # On Windows, a directory on another drive has no relative path.
+            rel_dir = None
+        if rel_dir is None or rel_dir == ".":
+            prefix = ""
+        else:
+            prefix = os.path.join(rel_dir, "").replace("\\", "/")
+
+        result: list[File] = []
+        subdirs: list[str] = []
+        for entry in self._walk_entries(path, False):
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            if rel_dir is not None and self._match_entry(
+                entry, args, keyword, mime_types
+            ):
+                logical_path = prefix + entry.name
+                result.append(self._entry_to_file(entry, logical_path, mime_types))
+        return result, subdirs
+
     def _walk_entries(self, path: str, recursive: bool) -> Generator[os.DirEntry[str]]:
-        if recursive:
-            for root, _dirs, _files in os.walk(path):
-                for entry in os.scandir(root):
-                    if not entry.is_junction() and not entry.is_symlink():
+        """
+        Yield directory entries, skipping symlinks and junctions.
+        Each directory is scanned once, in the same top-down order as os.walk.
+        Unreadable subdirectories are skipped, but errors on path itself raise.
+        """
+        pending = [path]
+        while pending:
+            directory = pending.pop()
+            subdirs: list[str] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_junction() or entry.is_symlink():
+                            continue
                         yield entry
-        else:
-            for entry in os.scandir(path):
-                if not entry.is_junction() and not entry.is_symlink():
-                    yield entry
+                        if recursive and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+            except FileNotFoundError as error:
+                if directory == path:
+                    raise NotFoundError("Directory not found.") from error
+                continue
+            except OSError:
+                if directory == path:
+                    raise
+                # Like os.walk, skip directories that cannot be read.
+                continue
+            pending.extend(reversed(subdirs))
 
-    def _match_entry(self, entry: os.DirEntry[str], args: SearchArgs) -> bool:
+    def _match_entry(
+        self,
+        entry: os.DirEntry[str],
+        args: SearchArgs,
+        keyword: str | None,
+        mime_types: dict[str, str | None],
+    ) -> bool:
+        # The name check is the cheapest filter, so it runs first.
+        if keyword and keyword not in entry.name.lower():
+            return False
         if args.type:
-            type_match = entry.is_file() if args.type == "file" else entry.is_dir()
+            # Without following links these are answered from readdir's d_type.
+            type_match = (
+                entry.is_file(follow_symlinks=False)
+                if args.type == "file"
+                else entry.is_dir(follow_symlinks=False)
+            )
             if not type_match:
                 return False
-        if args.keyword:
-            keyword_match = args.keyword.lower() in entry.name.lower()
-            if not keyword_match:
-                return False
         if args.mime_type:
-            mime_type = self._get_mime_type(entry.path)
+            mime_type = self._guess_mime_type(
+                entry.name, entry.is_dir(follow_symlinks=False), mime_types
+            )
             if args.mime_type.lower() not in mime_type.lower():
                 return False
 
         return True
 
     def _sort_files(self, files: list[File], args: SortArgs) -> list[File]:
+        key = SORT_KEYS[args.sort_by]
         reverse = args.sort_order == "desc"
-        sort_key: dict[str, Callable[[File], str | int | float | datetime]] = {
-            "name": lambda file: file.name,
-            "size": lambda file: file.size,
-            "created": lambda file: file.created_at,
-            "modified": lambda file: file.modified_at,
-            "accessed": lambda file: file.accessed_at,
-            "type": lambda file: file.mime_type,
-        }
-        files.sort(key=sort_key[args.sort_by], reverse=reverse)
-        if args.dir_first:
-            files.sort(key=lambda file: file.type == "file")
-        return files
+        if not args.dir_first:
+            files.sort(key=key, reverse=reverse)
+            return files
+        # Partition once instead of re-sorting the whole list by type.
+        directories = [file for file in files if file.type == Type.DIRECTORY]
+        others = [file for file in files if file.type != Type.DIRECTORY]
+        directories.sort(key=key, reverse=reverse)
+        others.sort(key=key, reverse=reverse)
+        return directories + others
@@ -0,0 +1,15 @@
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from lilycloudproto.config import auth_settings
+
+# Shared by every AuthService instance instead of being rebuilt per request.
+password_hash = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=auth_settings.ARGON2_TIME_COST,
+            memory_cost=auth_settings.ARGON2_MEMORY_COST,
+            parallelism=auth_settings.ARGON2_PARALLELISM,
+        ),
+    )
+)
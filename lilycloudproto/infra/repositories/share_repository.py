@@ -2,7 +2,8 @@ from sqlalchemy import asc, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lilycloudproto.domain.entities.share import Share
-from lilycloudproto.domain.values.share import ListArgs, SortBy, SortOrder
+from lilycloudproto.domain.values.share import ListArgs, SortBy
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class ShareRepository:
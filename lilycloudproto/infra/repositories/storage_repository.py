@@ -2,11 +2,8 @@ from sqlalchemy import asc, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lilycloudproto.domain.entities.storage import Storage
-from lilycloudproto.domain.values.admin.storage import (
-    ListArgs,
-    SortBy,
-    SortOrder,
-)
+from lilycloudproto.domain.values.admin.storage import ListArgs, SortBy
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class StorageRepository:
@@ -1,8 +1,12 @@
+from collections.abc import Iterable
+
 from sqlalchemy import String, asc, cast, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
-from lilycloudproto.domain.entities.task import Task
-from lilycloudproto.domain.values.admin.task import ListArgs, SortBy, SortOrder
+from lilycloudproto.domain.entities.task import ACTIVE_STATUSES, Task
+from lilycloudproto.domain.values.admin.task import ListArgs, SortBy, TaskType
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class TaskRepository:
@@ -18,11 +22,27 @@ class TaskRepository:
         await self.db.refresh(task)
         return task
 
-    async def get_by_id(self, task_id: int) -> Task | None:
-        """Retrieve a task by ID."""
-        result = await self.db.execute(select(Task).where(Task.task_id == task_id))
+    async def get_by_id(self, task_id: int, load_message: bool = True) -> Task | None:
+        """Retrieve a task by ID, optionally leaving its message unloaded."""
+        statement = select(Task).where(Task.task_id == task_id)
+        if not load_message:
+            statement = statement.options(defer(Task.message))
+        result = await self.db.execute(statement)
         return result.scalar_one_or_none()
 
+    async def list_active(self, types: Iterable[TaskType]) -> list[Task]:
+        """Retrieve unfinished tasks of the given types, oldest first."""
+        # Repeat the ix_tasks_active predicate verbatim so the partial index
+        # can serve the query.
+        statement = (
+            select(Task)
+            .where(ACTIVE_STATUSES, Task.type.in_(list(types)))
+            .order_by(Task.created_at)
+            .options(defer(Task.message))
+        )
+        result = await self.db.execute(statement)
+        return list(result.scalars().all())
+
     async def search(
         self,
         args: ListArgs,
@@ -1,7 +1,10 @@
+from datetime import datetime
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lilycloudproto.domain.entities.token import Token
+from lilycloudproto.domain.values.auth import TokenType
 
 
 class TokenRepository:
@@ -22,6 +25,18 @@ class TokenRepository:
         result = await self.db.execute(select(Token).where(Token.token_id == token_id))
         return result.scalar_one_or_none()
 
+    async def get_claims(
+        self, token_id: int
+    ) -> tuple[TokenType, int | None, datetime] | None:
+        """Retrieve only the columns needed to validate a token."""
+        result = await self.db.execute(
+            select(Token.type, Token.user_id, Token.expires_at).where(
+                Token.token_id == token_id
+            )
+        )
+        row = result.one_or_none()
+        return row.tuple() if row else None
+
     async def update(self, token: Token) -> Token:
         """Update a token."""
         await self.db.commit()
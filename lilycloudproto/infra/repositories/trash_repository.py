@@ -1,8 +1,9 @@
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import asc, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lilycloudproto.domain.entities.trash import Trash
-from lilycloudproto.domain.values.trash import ListArgs, SortBy, SortOrder
+from lilycloudproto.domain.values.sort import SortOrder
+from lilycloudproto.domain.values.trash import ListArgs, SortBy
 
 
 class TrashRepository:
@@ -99,28 +100,6 @@ class TrashRepository:
         result = await self.db.execute(statement)
         return list(result.scalars().all())
 
-    async def count(self, args: ListArgs) -> int:
-        statement = select(func.count()).select_from(Trash)
-
-        if args.keyword:
-            statement = statement.where(
-                (Trash.entry_name.ilike(f"%{args.keyword}%"))
-                | (
-                    getattr(Trash, "original_path", Trash.entry_name).ilike(
-                        f"%{args.keyword}%"
-                    )
-                )
-            )
-        if args.user_id:
-            statement = statement.where(Trash.user_id == args.user_id)
-        if args.type:
-            statement = statement.where(Trash.type == args.type)
-        if args.mime_type:
-            statement = statement.where(Trash.mime_type == args.mime_type)
-
-        result = await self.db.execute(statement)
-        return result.scalar_one() or 0
-
     async def update(self, trash: Trash) -> Trash:
         """Update an existing trash entry in the database."""
         await self.db.commit()
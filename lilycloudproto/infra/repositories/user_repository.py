@@ -1,12 +1,10 @@
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import asc, desc, func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from lilycloudproto.domain.entities.user import User
-from lilycloudproto.domain.values.admin.user import (
-    ListArgs,
-    SortBy,
-    SortOrder,
-)
+from lilycloudproto.domain.values.admin.user import ListArgs, SortBy
+from lilycloudproto.domain.values.sort import SortOrder
+from lilycloudproto.infra.database import utc_now
 
 
 class UserRepository:
@@ -26,15 +24,46 @@ class UserRepository:
 
     async def get_by_id(self, user_id: int) -> User | None:
         """Retrieve a user by their ID. Returns None if not found."""
-        result = await self.db.execute(select(User).where(User.user_id == user_id))
+        # Lambda statements are built and compiled once, then only rebound.
+        statement = lambda_stmt(lambda: select(User).where(User.user_id == user_id))
+        result = await self.db.execute(statement)
         return result.scalar_one_or_none()
 
     async def get_by_username(self, username: str) -> User | None:
         """Retrieve a user by their username. Returns None if not found."""
-        statement = select(User).where(User.username == username)
+        statement = lambda_stmt(lambda: select(User).where(User.username == username))
         result = await self.db.execute(statement)
         return result.scalar_one_or_none()
 
+    async def exists_by_username(self, username: str) -> bool:
+        """Check whether a username is taken without loading the user."""
+        statement = lambda_stmt(
+            lambda: select(User.user_id).where(User.username == username).limit(1)
+        )
+        result = await self.db.execute(statement)
+        return result.first() is not None
+
+    async def get_credentials(self, username: str) -> tuple[int, str] | None:
+        """Retrieve only the ID and password hash of a user by their username."""
+        statement = lambda_stmt(
+            lambda: select(User.user_id, User.hashed_password).where(
+                User.username == username
+            )
+        )
+        result = await self.db.execute(statement)
+        row = result.one_or_none()
+        return row.tuple() if row else None
+
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        """Replace a user's password hash without loading the user."""
+        statement = (
+            update(User)
+            .where(User.user_id == user_id)
+            .values(hashed_password=hashed_password, updated_at=utc_now())
+        )
+        _ = await self.db.execute(statement)
+        await self.db.commit()
+
     async def search(self, args: ListArgs) -> list[User]:
         """Search for users based on query parameters."""
         offset = (args.page - 1) * args.page_size
@@ -11,7 +11,7 @@ async def seed_admin(service: AuthService) -> None:
         result = await session.execute(select(User).where(User.role == "admin"))
         admin = result.scalar_one_or_none()
         if not admin:
-            hashed_password = service.password_hash.hash(admin_settings.ADMIN_PASSWORD)
+            hashed_password = await service.hash_password(admin_settings.ADMIN_PASSWORD)
             admin_user = User(
                 username=admin_settings.ADMIN_USERNAME,
                 hashed_password=hashed_password,
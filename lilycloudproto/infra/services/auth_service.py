@@ -1,32 +1,109 @@
-from datetime import UTC, datetime, timedelta
+import asyncio
+import hmac
+import json
+import math
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 import jwt
-from pwdlib import PasswordHash
-from pwdlib.hashers.argon2 import Argon2Hasher
-from pydantic import BaseModel
+from jwt.algorithms import HMACAlgorithm, get_default_algorithms
+from jwt.utils import base64url_encode
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from lilycloudproto.config import AuthSettings
 from lilycloudproto.domain.entities.token import Token
 from lilycloudproto.domain.entities.user import User
 from lilycloudproto.domain.values.auth import TokenType
 from lilycloudproto.error import AuthenticationError
+from lilycloudproto.infra.hashing import password_hash
 from lilycloudproto.infra.repositories.token_repository import TokenRepository
 from lilycloudproto.infra.repositories.user_repository import UserRepository
 
+# Validated access tokens are cached for at most this many seconds.
+USER_CACHE_TTL = 60
+USER_CACHE_MAX_SIZE = 10_000
+
+# Compact JSON of a Payload, in field order.
+CLAIMS_FORMAT = '{{"token_id":{},"user_id":{},"exp":{}}}'
+
+
+@lru_cache(maxsize=8)
+def _token_signer(
+    secret_key: str, algorithm: str
+) -> tuple[bytes, Callable[[bytes], bytes]]:
+    """
+    Prepare the encoded JWT header and a signing function once per key and
+    algorithm. jwt.encode re-parses the key on every call; tokens are still
+    verified with PyJWT.
+    """
+    signer = get_default_algorithms()[algorithm]
+    key = signer.prepare_key(secret_key)
+    header = json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":"))
+    prefix = base64url_encode(header.encode()) + b"."
+
+    if isinstance(signer, HMACAlgorithm):
+        # Every token starts with the same header, so key the HMAC and feed
+        # the header once, then clone that state per token.
+        template = hmac.new(key, prefix, signer.hash_alg)
+
+        def sign(claims: bytes) -> bytes:
+            mac = template.copy()
+            mac.update(claims)
+            return mac.digest()
+
+    else:
+
+        def sign(claims: bytes) -> bytes:
+            return signer.sign(prefix + claims, key)
+
+    return prefix, sign
+
+
+def _timestamp(expires_at: datetime) -> int:
+    if expires_at.tzinfo is None:
+        # SQLite3 does not support timezone-aware datetime.
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return int(expires_at.timestamp())
+
+
+def _snapshot_user(user: User) -> Mapping[str, Any]:
+    """Copy a user's column values for the user cache."""
+    return MappingProxyType(
+        {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    )
+
+
+def _restore_user(values: Mapping[str, Any]) -> User:
+    # Every request gets its own detached instance, as if freshly loaded, so
+    # no ORM object is ever shared between concurrent sessions.
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
 
 class Payload(BaseModel):
     token_id: int
     user_id: int
-    expires_at: datetime
+    # Expiry as a POSIX timestamp, the JWT "exp" claim.
+    exp: int
 
 
 class AuthService:
-    password_hash: PasswordHash
     settings: AuthSettings
     db: AsyncSession
-    _dummy_hash: str | None = None
+    # Cost of one password verification, measured at startup.
+    _verify_delay: ClassVar[float | None] = None
+    # Shared across per-request instances, keyed by raw access token. Holds
+    # read-only column snapshots rather than ORM instances.
+    _user_cache: ClassVar[dict[str, tuple[Mapping[str, Any], float]]] = {}
 
     def __init__(
         self,
@@ -34,48 +111,43 @@ class AuthService:
         db: AsyncSession,
     ):
         self.settings = settings
-        self.password_hash = PasswordHash(
-            (
-                Argon2Hasher(
-                    time_cost=self.settings.ARGON2_TIME_COST,
-                    memory_cost=self.settings.ARGON2_MEMORY_COST,
-                    parallelism=self.settings.ARGON2_PARALLELISM,
-                ),
-            )
-        )
         self.db = db
-        self._dummy_hash = self.password_hash.hash(
-            "dummy_password_for_timing_protection"
-        )
 
     async def authenticate(self, username: str, password: str) -> tuple[str, str]:
+        # Login only needs the ID and hash, so skip loading the full user.
         user_repo = UserRepository(self.db)
-        user = await user_repo.get_by_username(username)
-        hash_to_verify = user.hashed_password if user else str(self._dummy_hash)
-        is_password_correct = self.password_hash.verify(password, hash_to_verify)
-        if user is None or not is_password_correct:
+        credentials = await user_repo.get_credentials(username)
+        user_id = await self._verify_password(credentials, password)
+        if user_id is None:
             raise AuthenticationError("Incorrect username or password.")
-        return await self._generate_tokens(user)
+        return await self._generate_tokens(user_id)
 
     async def authenticate_basic(self, username: str, password: str) -> User | None:
         user_repo = UserRepository(self.db)
         user = await user_repo.get_by_username(username)
-        hash_to_verify = user.hashed_password if user else str(self._dummy_hash)
-        is_password_correct = self.password_hash.verify(password, hash_to_verify)
-        if user is None or not is_password_correct:
+        credentials = (user.user_id, user.hashed_password) if user else None
+        if await self._verify_password(credentials, password) is None:
             return None
         return user
 
     async def register(self, username: str, password: str) -> User:
-        hashed_password = self.password_hash.hash(password)
+        # Reject taken usernames before paying for an Argon2 hash.
+        user_repo = UserRepository(self.db)
+        if await user_repo.exists_by_username(username):
+            raise AuthenticationError("Username already registered.")
+        hashed_password = await self.hash_password(password)
         user = User(username=username, hashed_password=hashed_password)
+        # A concurrent registration can still take the name in between.
         try:
-            user_repo = UserRepository(self.db)
             created_user = await user_repo.create(user)
             return created_user
         except IntegrityError as error:
             raise AuthenticationError("Username already registered.") from error
 
+    async def hash_password(self, password: str) -> str:
+        """Hash a password in a worker thread to keep the event loop responsive."""
+        return await asyncio.to_thread(password_hash.hash, password)
+
     async def refresh(self, refresh_token: str) -> str:
         payload = self._decode_token(refresh_token)
 
@@ -87,42 +159,38 @@ class AuthService:
 
         # Get the token from database to validate the refresh token.
         token_repo = TokenRepository(self.db)
-        token_entity = await token_repo.get_by_id(payload.token_id)
+        claims = await token_repo.get_claims(payload.token_id)
 
         # Check if the token exists.
-        if not token_entity:
+        if not claims:
             raise AuthenticationError("Invalid refresh token.")
 
         # Check if the token is valid.
-        if token_entity.expires_at.tzinfo is None:
-            # SQLite3 does not support timezone-aware datetime.
-            token_entity.expires_at = token_entity.expires_at.replace(tzinfo=UTC)
+        token_type, token_user_id, token_expires_at = claims
         if (
-            token_entity.type != TokenType.REFRESH
-            or token_entity.user_id != payload.user_id
-            or token_entity.expires_at != payload.expires_at
+            token_type != TokenType.REFRESH
+            or token_user_id != payload.user_id
+            or _timestamp(token_expires_at) != payload.exp
         ):
             raise AuthenticationError("Invalid refresh token.")
 
         # Create new access token entity.
-        expires_at = datetime.now(UTC) + timedelta(
-            minutes=self.settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        exp = int(time.time()) + self.settings.access_token_lifetime
         access_token_entity = Token(
-            type=TokenType.ACCESS, user_id=user.user_id, expires_at=expires_at
+            type=TokenType.ACCESS,
+            user_id=user.user_id,
+            expires_at=datetime.fromtimestamp(exp, UTC),
         )
         access_token_entity = await token_repo.create(access_token_entity)
 
         # Create new access token.
-        payload = Payload(
-            token_id=access_token_entity.token_id,
-            user_id=user.user_id,
-            expires_at=expires_at,
+        access_token = self._encode_token(
+            access_token_entity.token_id, user.user_id, exp
         )
-        access_token = self._encode_token(payload)
         return access_token
 
     async def delete(self, token: str) -> None:
+        _ = self._user_cache.pop(token, None)
         try:
             payload = self._decode_token(token)
         except Exception:
@@ -135,6 +203,10 @@ class AuthService:
             await token_repo.delete(token_entity)
 
     async def get_user_from_token(self, token: str) -> User:
+        cached_user = self.get_cached_user(token)
+        if cached_user is not None:
+            return cached_user
+
         payload = self._decode_token(token)
 
         # Check if user exists.
@@ -145,78 +217,144 @@ class AuthService:
 
         # Get the token from database to validate the access token.
         token_repo = TokenRepository(self.db)
-        token_entity = await token_repo.get_by_id(payload.token_id)
+        claims = await token_repo.get_claims(payload.token_id)
 
         # Check if the token exists.
-        if not token_entity:
+        if not claims:
             raise AuthenticationError("Invalid access token.")
 
         # Check if the token is valid.
-        if token_entity.expires_at.tzinfo is None:
-            # SQLite3 does not support timezone-aware datetime.
-            token_entity.expires_at = token_entity.expires_at.replace(tzinfo=UTC)
+        token_type, token_user_id, token_expires_at = claims
         if (
-            token_entity.type != TokenType.ACCESS
-            or token_entity.user_id != payload.user_id
-            or token_entity.expires_at != payload.expires_at
+            token_type != TokenType.ACCESS
+            or token_user_id != payload.user_id
+            or _timestamp(token_expires_at) != payload.exp
         ):
             raise AuthenticationError("Invalid access token.")
 
+        self._cache_user(token, user, payload.exp)
         return user
 
-    def _encode_token(self, payload: Payload) -> str:
-        return jwt.encode(  # pyright: ignore[reportUnknownMemberType]
-            payload.model_dump(mode="json"),
-            self.settings.SECRET_KEY,
-            algorithm=self.settings.ALGORITHM,
+    @classmethod
+    async def calibrate_verify_delay(cls) -> float:
+        """Time one password verification for unknown-username logins to match."""
+        dummy_hash = await asyncio.to_thread(
+            password_hash.hash, "dummy_password_for_timing"
+        )
+        started = time.perf_counter()
+        _ = await asyncio.to_thread(password_hash.verify, "dummy_password", dummy_hash)
+        # Round up to the next 10 ms so the delay never undershoots.
+        elapsed = time.perf_counter() - started
+        cls._verify_delay = math.ceil(elapsed * 100) / 100
+        return cls._verify_delay
+
+    @classmethod
+    def get_cached_user(cls, token: str) -> User | None:
+        """Return the user of a recently validated access token, if any."""
+        cached = cls._user_cache.get(token)
+        if cached is None:
+            return None
+        values, cached_until = cached
+        if cached_until > time.time():
+            return _restore_user(values)
+        _ = cls._user_cache.pop(token, None)
+        return None
+
+    @classmethod
+    def evict_user(cls, user_id: int) -> None:
+        """Drop cached tokens of a user whose account was changed or deleted."""
+        stale = [
+            token
+            for token, (values, _) in cls._user_cache.items()
+            if values["user_id"] == user_id
+        ]
+        for token in stale:
+            del cls._user_cache[token]
+
+    def _cache_user(self, token: str, user: User, exp: int) -> None:
+        # Evict the oldest entry when the cache is full.
+        if len(self._user_cache) >= USER_CACHE_MAX_SIZE:
+            del self._user_cache[next(iter(self._user_cache))]
+        cached_until = min(time.time() + USER_CACHE_TTL, exp)
+        self._user_cache[token] = (_snapshot_user(user), cached_until)
+
+    async def _verify_password(
+        self, credentials: tuple[int, str] | None, password: str
+    ) -> int | None:
+        """Check a password against a user's (ID, hash) pair."""
+        if credentials is None:
+            # Take as long as a real verification without spending Argon2 CPU
+            # and memory on unknown usernames. Response-time variance still
+            # differs slightly from a real hash, which is the accepted trade.
+            # The lifespan calibrates at startup; measure here only when the
+            # service runs without it.
+            delay = AuthService._verify_delay
+            if delay is None:
+                delay = await AuthService.calibrate_verify_delay()
+            await asyncio.sleep(delay)
+            return None
+        # Argon2 is deliberately slow, so verify off the event loop.
+        is_password_correct, updated_hash = await asyncio.to_thread(
+            password_hash.verify_and_update, password, credentials[1]
         )
+        if not is_password_correct:
+            return None
+        if updated_hash is not None:
+            # Upgrade hashes made with outdated Argon2 parameters.
+            user_repo = UserRepository(self.db)
+            await user_repo.update_password(credentials[0], updated_hash)
+        return credentials[0]
+
+    def _encode_token(self, token_id: int, user_id: int, exp: int) -> str:
+        prefix, sign = _token_signer(self.settings.SECRET_KEY, self.settings.ALGORITHM)
+        # The claims are three integers, so format them directly rather than
+        # building and serializing a Payload; decoding still validates one.
+        claims = base64url_encode(CLAIMS_FORMAT.format(token_id, user_id, exp).encode())
+        return (prefix + claims + b"." + base64url_encode(sign(claims))).decode()
 
     def _decode_token(self, token: str) -> Payload:
         try:
-            data = jwt.decode(  # pyright: ignore[reportAny, reportUnknownMemberType]
+            # Verify the signature only and parse the claims straight into
+            # Payload; its expiry is checked below without a datetime round trip.
+            claims = jwt.api_jws.decode(
                 token, self.settings.SECRET_KEY, algorithms=[self.settings.ALGORITHM]
             )
-            return Payload.model_validate(data)
-        except jwt.ExpiredSignatureError as error:
-            raise AuthenticationError("Token has expired.") from error
-        except jwt.InvalidTokenError as error:
+            payload = Payload.model_validate_json(claims)
+        except (jwt.InvalidTokenError, ValidationError) as error:
             raise AuthenticationError("Could not validate credentials.") from error
+        if payload.exp <= time.time():
+            raise AuthenticationError("Token has expired.")
+        return payload
 
-    async def _generate_tokens(self, user: User) -> tuple[str, str]:
+    async def _generate_tokens(self, user_id: int) -> tuple[str, str]:
         token_repo = TokenRepository(self.db)
 
+        # Both expiries are offsets from the same whole-second timestamp.
+        now = int(time.time())
+
         # Create access token.
-        access_token_expires = datetime.now(UTC) + timedelta(
-            minutes=self.settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        access_token_exp = now + self.settings.access_token_lifetime
         access_token_entity = Token(
-            type=TokenType.ACCESS, user_id=user.user_id, expires_at=access_token_expires
+            type=TokenType.ACCESS,
+            user_id=user_id,
+            expires_at=datetime.fromtimestamp(access_token_exp, UTC),
         )
         access_token_entity = await token_repo.create(access_token_entity)
 
         # Create refresh token.
-        refresh_token_expires = datetime.now(UTC) + timedelta(
-            days=self.settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
+        refresh_token_exp = now + self.settings.refresh_token_lifetime
         refresh_token_entity = Token(
             type=TokenType.REFRESH,
-            user_id=user.user_id,
-            expires_at=refresh_token_expires,
+            user_id=user_id,
+            expires_at=datetime.fromtimestamp(refresh_token_exp, UTC),
         )
         refresh_token_entity = await token_repo.create(refresh_token_entity)
 
-        # Create payloads.
-        access_token_payload = Payload(
-            token_id=access_token_entity.token_id,
-            user_id=user.user_id,
-            expires_at=access_token_expires,
+        # Create tokens.
+        access_token = self._encode_token(
+            access_token_entity.token_id, user_id, access_token_exp
         )
-        refresh_token_payload = Payload(
-            token_id=refresh_token_entity.token_id,
-            user_id=user.user_id,
-            expires_at=refresh_token_expires,
+        refresh_token = self._encode_token(
+            refresh_token_entity.token_id, user_id, refresh_token_exp
         )
-
-        access_token = self._encode_token(access_token_payload)
-        refresh_token = self._encode_token(refresh_token_payload)
         return access_token, refresh_token
@@ -11,10 +11,12 @@ from lilycloudproto.infra.repositories.storage_repository import StorageReposito
 class StorageService:
     storage_repo: StorageRepository
     _cache: dict[str, Storage]
+    _drivers: dict[tuple[str, Base], Driver]
 
     def __init__(self, storage_repo: StorageRepository) -> None:
         self.storage_repo = storage_repo
         self._cache = {}
+        self._drivers = {}
 
     async def initialize(self) -> None:
         """
@@ -28,11 +30,13 @@ class StorageService:
     def update_cache(self, storage: Storage) -> None:
         """Update the cache when a storage is created or updated."""
         self._cache[storage.mount_path] = storage
+        self._drivers.clear()
 
     def remove_from_cache(self, mount_path: str) -> None:
         """Remove a storage from the cache when deleted."""
         if mount_path in self._cache:
             del self._cache[mount_path]
+        self._drivers.clear()
 
     def list_mounted_storages(self, enabled_only: bool = True) -> list[File]:
         """
@@ -81,6 +85,12 @@ class StorageService:
         storage = self._match_storage(path)
         print(f"Matched storage: {storage.type if storage else 'None'}")
 
+        # Reuse the driver built for this storage, config parsing is not free.
+        key = (storage.mount_path if storage else "/", base)
+        driver = self._drivers.get(key)
+        if driver is not None:
+            return driver
+
         # Fallback to default local storage if no match found.
         if not storage:
             config = LocalConfig(
@@ -97,7 +107,9 @@ class StorageService:
             )
 
         if storage.type == StorageType.LOCAL:
-            return LocalDriver(storage, base)
+            driver = LocalDriver(storage, base)
+            self._drivers[key] = driver
+            return driver
 
         # Add other drivers here (S3, SMB, etc.)
         raise NotImplementedError(f"Driver for type '{storage.type}' not implemented.")
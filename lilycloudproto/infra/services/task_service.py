@@ -25,6 +25,9 @@ class TaskService:
     async def stop(self) -> None:
         await self.task_worker.stop()
 
+    async def recover_tasks(self) -> None:
+        await self.task_worker.recover_tasks()
+
     async def add_task(  # noqa: PLR0913
         self,
         user_id: int,
@@ -76,10 +76,28 @@ class TaskWorker:
     async def add_task(self, task_id: int) -> None:
         await self._queue.put(TaskPayload(task_id))
 
+    async def recover_tasks(self) -> None:
+        """Pick up tasks left unfinished when the server last stopped."""
+        async with self.session_factory() as session:
+            repo = TaskRepository(session)
+            tasks = await repo.list_active(self._handlers)
+            for task in tasks:
+                if task.status == TaskStatus.PENDING:
+                    # The queue lives in memory, so queued tasks were lost.
+                    await self.add_task(task.task_id)
+                else:
+                    # A half-done copy or move cannot be safely run again.
+                    task.status = TaskStatus.FAILED
+                    task.message = "Interrupted by a server restart."
+                    task.completed_at = datetime.now(UTC)
+            await session.commit()
+        if tasks:
+            logger.info(f"Recovered {len(tasks)} unfinished tasks.")
+
     async def _process_task(self, task_id: int) -> None:
         async with self.session_factory() as session:
             repo = TaskRepository(session)
-            task = await repo.get_by_id(task_id)
+            task = await repo.get_by_id(task_id, load_message=False)
             if not task:
                 raise NotFoundError(f"Task '{task_id}' not found in database.")
 
@@ -169,16 +187,22 @@ class TaskWorker:
         await driver.trash(task.src_dir, task.file_names, progress_callback)
         driver = self.storage_service.get_driver(task.src_dir, Base.TRASH)
 
+        # Stat all trashed entries concurrently in the thread pool.
+        results = await asyncio.gather(
+            *(asyncio.to_thread(driver.info, name) for name in task.file_names),
+            return_exceptions=True,
+        )
+
         # Record all info in the Trash table.
         async with self.session_factory() as session:
             trash_repo = TrashRepository(session)
             now = datetime.now(UTC)
             trash_entries: list[Trash] = []
-            for name in task.file_names:
-                try:
-                    file_info = driver.info(name)
-                except NotFoundError:
+            for name, file_info in zip(task.file_names, results, strict=True):
+                if isinstance(file_info, NotFoundError):
                     continue
+                if isinstance(file_info, BaseException):
+                    raise file_info
                 trash_entry = Trash(
                     user_id=task.user_id,
                     entry_name=file_info.name,
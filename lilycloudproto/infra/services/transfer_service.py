@@ -4,12 +4,15 @@ import tempfile
 import zipfile
 from collections.abc import AsyncGenerator
 from datetime import datetime
+from functools import partial
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
-from lilycloudproto.domain.driver import Driver
+from lilycloudproto.domain.driver import DEFAULT_CHUNK_SIZE, Driver
 from lilycloudproto.domain.entities.task import Task
+from lilycloudproto.domain.pipe import pipe
 from lilycloudproto.domain.values.admin.task import TaskStatus, TaskType
 from lilycloudproto.infra.services.storage_service import StorageService
 from lilycloudproto.models.admin.task import TaskResponse
@@ -52,21 +55,23 @@ class TransferService:
         return TaskResponse.model_validate(task)
 
     async def process_upload_files(
-        self, task_id: int, dst_dir: str, files: list[bytes], filenames: list[str]
+        self,
+        task_id: int,
+        dst_dir: str,
+        streams: list[AsyncGenerator[bytes]],
+        filenames: list[str],
     ) -> None:
-        stmt = select(Task).where(Task.task_id == task_id)
+        stmt = select(Task).where(Task.task_id == task_id).options(defer(Task.message))
         result = await self.db.execute(stmt)
         task = result.scalar_one_or_none()
         if not task:
             return
 
         try:
-            total = len(files)
-            for i, (content, name) in enumerate(zip(files, filenames, strict=True)):
+            total = len(streams)
+            for i, (stream, name) in enumerate(zip(streams, filenames, strict=True)):
                 file_virtual_path = os.path.join(dst_dir, name)
-                await self.driver.write(
-                    file_virtual_path, self._bytes_to_stream(content)
-                )
+                await pipe(stream, partial(self.driver.write, file_virtual_path))
 
                 task.progress = ((i + 1) / total) * 100
                 task.updated_at = datetime.now()
@@ -118,6 +123,10 @@ class TransferService:
         if url:
             return DownloadResource("url", url, filename)
 
+        local_path = self.driver.get_local_path(virtual_path)
+        if local_path:
+            return DownloadResource("path", local_path, filename)
+
         return DownloadResource("stream", self.driver.read(virtual_path), filename)
 
     async def archive_stream_generator(self, task_id: int) -> AsyncGenerator[bytes]:
@@ -144,12 +153,12 @@ class TransferService:
                     try:
                         # Open a writable stream inside the ZIP.
                         with zf.open(fname, "w", force_zip64=True) as dest_file:
-                            source_stream = self.driver.read(
-                                file_virtual_path, chunk_size=64 * 1024
-                            )
+                            # Chunks are written out before the next read, so
+                            # the reusable buffer stream is safe here.
+                            source_stream = self.driver.read_view(file_virtual_path)
 
-                            async for chunk in source_stream:
-                                _ = dest_file.write(chunk)
+                            async for view in source_stream:
+                                _ = dest_file.write(view)
                                 await asyncio.sleep(0)
 
                     except Exception as error:
@@ -161,7 +170,7 @@ class TransferService:
 
             with open(temp_path, "rb") as f:
                 while True:
-                    chunk = f.read(64 * 1024)
+                    chunk = f.read(DEFAULT_CHUNK_SIZE)
                     if not chunk:
                         break
                     yield chunk
@@ -181,16 +190,3 @@ class TransferService:
             # Clean up the temporary file
             if os.path.exists(temp_path):
                 os.remove(temp_path)
-
-    async def _bytes_to_stream(
-        self, content: bytes, chunk_size: int = 64 * 1024
-    ) -> AsyncGenerator[bytes]:
-        """
-        Helper: wrap an in-memory bytes into an async generator yielding chunks.
-
-        Note: this still requires the bytes to be in memory. Prefer to accept
-        an async generator from the caller to avoid memory pressure for large uploads.
-        """
-        for i in range(0, len(content), chunk_size):
-            yield content[i : i + chunk_size]
-            await asyncio.sleep(0)
@@ -18,6 +18,16 @@ from lilycloudproto.apis.transfer import router as files_transfer
 from lilycloudproto.apis.trash import router as trash_router
 from lilycloudproto.apis.webdav import router as webdav_router
 from lilycloudproto.config import AuthSettings
+
+# Register every table on Base.metadata before init_db runs create_all.
+from lilycloudproto.domain.entities import (  # pyright: ignore[reportUnusedImport]  # noqa: F401
+    share,
+    storage,
+    task,
+    token,
+    trash,
+    user,
+)
 from lilycloudproto.error import TeapotError, register_error_handlers
 from lilycloudproto.infra.database import AsyncSessionLocal, init_db
 from lilycloudproto.infra.repositories.storage_repository import StorageRepository
@@ -47,6 +57,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         auth_settings = AuthSettings()
         auth_service = AuthService(settings=auth_settings, db=session)
         app.state.auth_service = auth_service
+        # Time password verification once, before serving any logins.
+        _ = await AuthService.calibrate_verify_delay()
+
+        # Requeue unfinished tasks before new ones can be added.
+        await task_service.recover_tasks()
 
         # Start background task worker.
         background_task = asyncio.create_task(task_service.start())
@@ -5,10 +5,10 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from lilycloudproto.domain.values.admin.storage import (
     SortBy,
-    SortOrder,
     StorageConfig,
     StorageType,
 )
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class StorageCreate(BaseModel):
@@ -52,7 +52,3 @@ class StorageListQuery(BaseModel):
     enabled_first: bool = Field(True)
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
-
-
-class MessageResponse(BaseModel):
-    message: str
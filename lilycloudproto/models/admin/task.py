@@ -6,10 +6,10 @@ from pydantic import BaseModel, ConfigDict, Field
 from lilycloudproto.domain.driver import Base
 from lilycloudproto.domain.values.admin.task import (
     SortBy,
-    SortOrder,
     TaskStatus,
     TaskType,
 )
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class TaskCreate(BaseModel):
@@ -73,7 +73,3 @@ class TaskListQuery(BaseModel):
     sort_order: SortOrder = Field(SortOrder.DESC)
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
-
-
-class MessageResponse(BaseModel):
-    message: str
@@ -3,7 +3,8 @@ from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from lilycloudproto.domain.values.admin.user import Role, SortBy, SortOrder
+from lilycloudproto.domain.values.admin.user import Role, SortBy
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class UserCreate(BaseModel):
@@ -42,7 +43,3 @@ class UserListQuery(BaseModel):
     sort_order: SortOrder = Field(SortOrder.DESC)
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
-
-
-class MessageResponse(BaseModel):
-    message: str
@@ -1,7 +1,8 @@
 from pydantic import BaseModel
 
 from lilycloudproto.domain.values.files.file import File, Type
-from lilycloudproto.domain.values.files.sort import SortBy, SortOrder
+from lilycloudproto.domain.values.files.sort import SortBy
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class SearchQuery(BaseModel):
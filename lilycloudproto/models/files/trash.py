@@ -4,7 +4,8 @@ from typing import ClassVar
 from pydantic import BaseModel, ConfigDict, Field
 
 from lilycloudproto.domain.values.files.file import Type
-from lilycloudproto.domain.values.trash import SortBy, SortOrder
+from lilycloudproto.domain.values.sort import SortOrder
+from lilycloudproto.domain.values.trash import SortBy
 
 
 class TrashCommand(BaseModel):
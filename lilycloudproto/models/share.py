@@ -4,7 +4,8 @@ from typing import ClassVar
 from pydantic import BaseModel, ConfigDict
 
 from lilycloudproto.domain.entities.share import Share
-from lilycloudproto.domain.values.share import Permission, SortBy, SortOrder
+from lilycloudproto.domain.values.share import Permission, SortBy
+from lilycloudproto.domain.values.sort import SortOrder
 
 
 class ShareCreate(BaseModel):
@@ -71,10 +72,6 @@ class ShareListQuery(BaseModel):
     page_size: int = 20
 
 
-class MessageResponse(BaseModel):
-    message: str
-
-
 class ShareInfoResponse(BaseModel):
     username: str
     token: str
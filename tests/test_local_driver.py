@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from lilycloudproto.domain.entities.storage import Storage
+from lilycloudproto.domain.values.admin.storage import StorageType
+from lilycloudproto.domain.values.files.list import ListArgs
+from lilycloudproto.infra.drivers.local_driver import LocalDriver
+
+
+def make_driver(tmp_path: Path) -> LocalDriver:
+    storage = Storage(
+        type=StorageType.LOCAL,
+        mount_path="/",
+        config={
+            "root_path": str(tmp_path / "root"),
+            "trash_path": str(tmp_path / "trash"),
+        },
+    )
+    return LocalDriver(storage)
+
+
+def test_dotfile_does_not_poison_mime_memo(tmp_path: Path) -> None:
+    driver = make_driver(tmp_path)
+    mime_types: dict[str, str | None] = {}
+    names = [".json", "data.json", ".html", "index.html"]
+    guesses = [driver._guess_mime_type(name, False, mime_types) for name in names]
+    assert guesses == [
+        "application/octet-stream",
+        "application/json",
+        "application/octet-stream",
+        "text/html",
+    ]
+
+
+def test_list_dir_mime_types(tmp_path: Path) -> None:
+    driver = make_driver(tmp_path)
+    root = tmp_path / "root"
+    for name in [".json", "data.json", "DATA2.JSON", "a.tar.gz", "b.gz"]:
+        _ = (root / name).write_text("x")
+    files = driver.list_dir(ListArgs(path="/"))
+    assert {file.name: file.mime_type for file in files} == {
+        ".json": "application/octet-stream",
+        "data.json": "application/json",
+        "DATA2.JSON": "application/json",
+        "a.tar.gz": "application/x-tar",
+        "b.gz": "application/octet-stream",
+    }
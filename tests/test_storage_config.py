@@ -0,0 +1,33 @@
+from typing import Any, cast
+
+import pytest
+from pydantic import ValidationError
+
+from lilycloudproto.domain.values.admin.storage import StorageType, validate_config
+
+
+def test_validate_config_memoizes_raw_configs() -> None:
+    config = {"root_path": "/srv/root", "trash_path": "/srv/trash"}
+    assert validate_config(StorageType.LOCAL, config) == config
+    assert validate_config(StorageType.LOCAL, config) == config
+
+
+def test_validate_config_with_unhashable_value() -> None:
+    config = cast(
+        dict[str, str],
+        {"root_path": ["/srv/root"], "trash_path": "/srv/trash"},
+    )
+    with pytest.raises(ValidationError):
+        _ = validate_config(StorageType.LOCAL, config)
+
+
+def test_validate_config_ignores_unhashable_extras() -> None:
+    config: dict[str, Any] = {
+        "root_path": "/srv/root",
+        "trash_path": "/srv/trash",
+        "tags": ["a", "b"],
+    }
+    assert validate_config(StorageType.LOCAL, cast(dict[str, str], config)) == {
+        "root_path": "/srv/root",
+        "trash_path": "/srv/trash",
+    }